@@ -253,29 +253,34 @@ class ShutdownManager:
             return False
 
 
+def install_fast_event_loop() -> None:
+    """如果安装了 uvloop，则使用它作为事件循环实现（Windows 下保持默认的 Proactor 循环）"""
+    if platform.system() == "Windows":
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("未安装 uvloop，使用默认 asyncio 事件循环")
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("已启用 uvloop 事件循环")
+
+
 @asynccontextmanager
 async def create_event_loop_context():
-    """创建事件循环的上下文管理器"""
-    loop = None
+    """事件循环的上下文管理器：在退出时对当前运行中的循环执行优雅关闭"""
+    # 直接使用 asyncio.run 创建的运行中循环，不再额外创建一个从未运行的循环；
+    # 循环本身由 asyncio.run 负责关闭
+    loop = asyncio.get_running_loop()
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         yield loop
-    except Exception as e:
-        logger.error(f"创建事件循环失败: {e}")
-        raise
     finally:
-        if loop and not loop.is_closed():
-            try:
-                await ShutdownManager.graceful_shutdown(loop)
-            except Exception as e:
-                logger.error(f"关闭事件循环时出错: {e}")
-            finally:
-                try:
-                    loop.close()
-                    logger.info("事件循环已关闭")
-                except Exception as e:
-                    logger.error(f"关闭事件循环失败: {e}")
+        try:
+            await ShutdownManager.graceful_shutdown(loop)
+        except Exception as e:
+            logger.error(f"关闭事件循环时出错: {e}")
 
 
 class DatabaseManager:
@@ -674,6 +679,7 @@ async def main_async():
 if __name__ == "__main__":
     exit_code = 0
     try:
+        install_fast_event_loop()
         exit_code = asyncio.run(main_async())
     except KeyboardInterrupt:
         logger.info("程序被用户中断")
@@ -235,7 +235,7 @@ class ExpressionLearner:
         recent_messages = await get_raw_msg_by_timestamp_with_chat_inclusive(
             chat_id=self.chat_id,
             timestamp_start=self.last_learning_time,
-            timestamp_end=time.time(),
+            timestamp_end=current_time,
             filter_bot=True,  # 过滤掉机器人自己的消息
         )
 
@@ -157,8 +157,8 @@ class ChatBot:
 
             message.is_command = True
 
-            # 获取插件配置
-            plugin_config = component_registry.get_plugin_config(plus_command_name)
+            # 获取插件配置（共享视图，命令内 get_config 无需逐层解析点号路径）
+            plugin_config = component_registry.get_plugin_config_view(plus_command_name)
 
             # 创建PlusCommand实例
             plus_command_instance = plus_command_class(message, plugin_config)
@@ -232,8 +232,8 @@ class ChatBot:
 
                 message.is_command = True
 
-                # 获取插件配置
-                plugin_config = component_registry.get_plugin_config(plugin_name)
+                # 获取插件配置（共享视图，命令内 get_config 无需逐层解析点号路径）
+                plugin_config = component_registry.get_plugin_config_view(plugin_name)
 
                 # 创建命令实例
                 command_instance: BaseCommand = command_class(message, plugin_config)
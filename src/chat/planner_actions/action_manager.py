@@ -9,7 +9,7 @@ from src.common.data_models.database_data_model import DatabaseMessages
 from src.common.logger import get_logger
 from src.config.config import global_config
 from src.person_info.person_info import get_person_info_manager
-from src.plugin_system.apis import database_api, generator_api, message_api, send_api
+from src.plugin_system.apis import database_api, generator_api, send_api
 from src.plugin_system.base.base_action import BaseAction
 from src.plugin_system.base.component_types import ActionInfo, ComponentType
 from src.plugin_system.core.component_registry import component_registry
@@ -311,7 +311,7 @@ class ChatterActionManager:
                     reply_text, cycle_timers_reply = await self._send_and_store_reply(
                         chat_stream,
                         response_set,
-                        asyncio.get_event_loop().time(),
+                        asyncio.get_running_loop().time(),
                         target_message,
                         {},  # cycle_timers
                         thinking_id,
@@ -572,13 +572,6 @@ class ChatterActionManager:
         - 逐段发送回复内容，支持打字效果
         - 正确处理元组格式的回复段
         """
-        current_time = time.time()
-        # 计算新消息数量
-        await message_api.count_new_messages(
-            chat_id=chat_stream.stream_id, start_time=thinking_start_time, end_time=current_time
-        )
-
-        # 根据新消息数量决定是否需要引用回复
         reply_text = ""
         # 检查是否为主动思考消息
         if message_data:
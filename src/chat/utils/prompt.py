@@ -6,6 +6,7 @@
 import asyncio
 import contextvars
 import re
+import string
 import time
 from contextlib import asynccontextmanager
 from typing import Any, Optional
@@ -302,6 +303,8 @@ class Prompt:
 
         # 预处理模板，将转义的花括号替换为临时标记
         self._processed_template = self._process_escaped_braces(template)
+        # 预编译模板片段，关键字参数格式化时直接拼接，免去每次 str.format 重新解析
+        self._compiled_segments = self._compile_template(self._processed_template)
 
         # 根据`should_register`标志和当前是否处于一个临时上下文中来决定是否进行全局注册
         # 如果在`async_scope`内，则不进行全局注册，由调用者决定是否进行上下文注册
@@ -320,6 +323,42 @@ class Prompt:
             "\\}", Prompt._TEMP_RIGHT_BRACE
         )
 
+    @staticmethod
+    def _compile_template(template: str) -> list[tuple[str, str | None, str | None, str]] | None:
+        """将模板预解析为 (字面量, 字段名, 转换符, 格式说明) 片段列表.
+
+        仅支持简单的具名占位符；遇到位置占位符、属性/下标访问、嵌套格式说明
+        或模板本身不合法时返回 None，由 `format` 回退到 `str.format`。
+        """
+        segments = []
+        try:
+            for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+                if field_name is not None:
+                    if (
+                        not field_name.isidentifier()
+                        or (format_spec and "{" in format_spec)
+                        or conversion not in (None, "r", "s", "a")
+                    ):
+                        return None
+                segments.append((literal, field_name, conversion, format_spec or ""))
+        except ValueError:
+            return None
+        return segments
+
+    def _render_compiled(self, kwargs: dict[str, Any]) -> str:
+        """按预编译片段渲染模板，语义与 `str.format(**kwargs)` 一致."""
+        parts: list[str] = []
+        append = parts.append
+        for literal, field_name, conversion, format_spec in self._compiled_segments:  # type: ignore[union-attr]
+            append(literal)
+            if field_name is None:
+                continue
+            value = kwargs[field_name]
+            if conversion is not None:
+                value = repr(value) if conversion == "r" else str(value) if conversion == "s" else ascii(value)
+            append(format(value, format_spec))
+        return "".join(parts)
+
     @staticmethod
     def _restore_escaped_braces(template: str) -> str:
         """在格式化完成后，将临时标记还原为实际的花括号字符 `{` 和 `}`."""
@@ -1018,7 +1057,10 @@ class Prompt:
 
             # 然后使用关键字参数对结果进行再次格式化
             if kwargs:
-                processed_template = processed_template.format(**kwargs)
+                if not args and self._compiled_segments is not None:
+                    processed_template = self._render_compiled(kwargs)
+                else:
+                    processed_template = processed_template.format(**kwargs)
 
             # 最后，将转义花括号的临时标记还原
             result = self._restore_escaped_braces(processed_template)
@@ -1,4 +1,3 @@
-import asyncio
 import random
 import re
 import string
@@ -806,29 +805,13 @@ async def get_chat_type_and_target_info(chat_id: str) -> tuple[bool, dict | None
                     person_name = None
                     if person_id:
                         person_info_manager = get_person_info_manager()
+                        # 本函数本身就是协程，直接 await；
+                        # 在运行中的循环上 run_coroutine_threadsafe 再阻塞等待只会一直超时
                         try:
-                            # 如果没有运行的事件循环，直接 asyncio.run
-                            loop = asyncio.get_event_loop()
-                            if loop.is_running():
-                                # 如果事件循环在运行，从其他线程提交并等待结果
-                                try:
-                                    fut = asyncio.run_coroutine_threadsafe(
-                                        person_info_manager.get_value(person_id, "person_name"), loop
-                                    )
-                                    person_name = fut.result(timeout=2)
-                                except Exception as e:
-                                    # 无法在运行循环上安全等待，退回为 None
-                                    logger.debug(f"无法通过运行的事件循环获取 person_name: {e}")
-                                    person_name = None
-                            else:
-                                person_name = asyncio.run(person_info_manager.get_value(person_id, "person_name"))
-                        except RuntimeError:
-                            # get_event_loop 在某些上下文可能抛出 RuntimeError，退回到 asyncio.run
-                            try:
-                                person_name = asyncio.run(person_info_manager.get_value(person_id, "person_name"))
-                            except Exception as e:
-                                logger.debug(f"获取 person_name 失败: {e}")
-                                person_name = None
+                            person_name = await person_info_manager.get_value(person_id, "person_name")
+                        except Exception as e:
+                            logger.debug(f"获取 person_name 失败: {e}")
+                            person_name = None
 
                     target_info["person_id"] = person_id
                     target_info["person_name"] = person_name
@@ -249,7 +249,7 @@ class LegacyVideoAnalyzer:
 
     async def _extract_frames_multiprocess(self, video_path: str) -> list[tuple[str, float]]:
         """线程池版本的帧提取"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         try:
             logger.info("🔄 启动线程池帧提取...")
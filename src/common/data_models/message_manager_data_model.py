@@ -8,7 +8,7 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 from src.common.logger import get_logger
 from src.plugin_system.base.component_types import ChatMode, ChatType
@@ -41,6 +41,10 @@ class DecisionRecord(BaseDataModel):
 class StreamContext(BaseDataModel):
     """聊天流上下文信息"""
 
+    # check_types 无法获取 format_info 时使用的备用类型集合（类级常量，导入时构建一次）
+    DEFAULT_SUPPORTED_TYPES: ClassVar[frozenset[str]] = frozenset({"text", "emoji"})
+    FALLBACK_ALLOWED_TYPES: ClassVar[frozenset[str]] = frozenset({"text", "emoji", "reply"})
+
     stream_id: str
     chat_type: ChatType = ChatType.PRIVATE  # 聊天类型，默认为私聊
     chat_mode: ChatMode = ChatMode.FOCUS  # 聊天模式，默认为专注模式
@@ -308,12 +312,11 @@ class StreamContext(BaseDataModel):
         # 备用方案：如果无法从additional_config获取格式信息，使用默认支持的类型
         # 大多数消息至少支持text类型
         logger.debug("[check_types] 使用备用方案：默认支持类型检查")
-        default_supported_types = ["text", "emoji"]
         for requested_type in types:
-            if requested_type not in default_supported_types:
+            if requested_type not in self.DEFAULT_SUPPORTED_TYPES:
                 logger.debug(f"[check_types] 使用默认类型检查，消息可能不支持类型 '{requested_type}'")
                 # 对于非基础类型，返回False以避免错误
-                if requested_type not in ["text", "emoji", "reply"]:
+                if requested_type not in self.FALLBACK_ALLOWED_TYPES:
                     logger.warning(f"[check_types] ❌ 备用方案拒绝类型 '{requested_type}'")
                     return False
         logger.debug("[check_types] ✅ 备用方案通过所有类型检查")
@@ -970,8 +970,12 @@ def configure_structlog():
     """配置structlog，加入自定义 metadata 处理器。"""
     structlog.configure(
         processors=[
+            # 先按级别过滤：被过滤的日志不再走后续处理器（时间戳格式化等）
+            structlog.stdlib.filter_by_level,
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
+            # 支持 logger.debug("...%s", value) 形式的延迟格式化
+            structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt=get_timestamp_format(), utc=False),
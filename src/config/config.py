@@ -45,11 +45,7 @@ from src.config.official_configs import (
     WebSearchConfig,
 )
 
-from .api_ada_configs import (
-    APIProvider,
-    ModelInfo,
-    ModelTaskConfig,
-)
+from .api_ada_configs import APIAdapterConfig
 
 install(extra_lines=3)
 
@@ -419,66 +415,6 @@ class Config(ValidatedConfigBase):
     )
 
 
-class APIAdapterConfig(ValidatedConfigBase):
-    """API Adapter配置类"""
-
-    models: list[ModelInfo] = Field(..., min_items=1, description="模型列表")
-    model_task_config: ModelTaskConfig = Field(..., description="模型任务配置")
-    api_providers: list[APIProvider] = Field(..., min_items=1, description="API提供商列表")
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.api_providers_dict = {provider.name: provider for provider in self.api_providers}
-        self.models_dict = {model.name: model for model in self.models}
-
-    @classmethod
-    def validate_models_list(cls, v):
-        """验证模型列表"""
-        if not v:
-            raise ValueError("模型列表不能为空，请在配置中设置有效的模型列表。")
-
-        # 检查模型名称是否重复
-        model_names = [model.name for model in v]
-        if len(model_names) != len(set(model_names)):
-            raise ValueError("模型名称存在重复，请检查配置文件。")
-
-        # 检查模型标识符是否有效
-        for model in v:
-            if not model.model_identifier:
-                raise ValueError(f"模型 '{model.name}' 的 model_identifier 不能为空")
-
-        return v
-
-    @classmethod
-    def validate_api_providers_list(cls, v):
-        """验证API提供商列表"""
-        if not v:
-            raise ValueError("API提供商列表不能为空，请在配置中设置有效的API提供商列表。")
-
-        # 检查API提供商名称是否重复
-        provider_names = [provider.name for provider in v]
-        if len(provider_names) != len(set(provider_names)):
-            raise ValueError("API提供商名称存在重复，请检查配置文件。")
-
-        return v
-
-    def get_model_info(self, model_name: str) -> ModelInfo:
-        """根据模型名称获取模型信息"""
-        if not model_name:
-            raise ValueError("模型名称不能为空")
-        if model_name not in self.models_dict:
-            raise KeyError(f"模型 '{model_name}' 不存在")
-        return self.models_dict[model_name]
-
-    def get_provider(self, provider_name: str) -> APIProvider:
-        """根据提供商名称获取API提供商信息"""
-        if not provider_name:
-            raise ValueError("API提供商名称不能为空")
-        if provider_name not in self.api_providers_dict:
-            raise KeyError(f"API提供商 '{provider_name}' 不存在")
-        return self.api_providers_dict[provider_name]
-
-
 def load_config(config_path: str) -> Config:
     """
     加载配置文件
@@ -435,6 +435,7 @@ class MemoryConfig(ValidatedConfigBase):
     path_expansion_max_branches: int = Field(default=10, description="每节点最大分叉数")
     path_expansion_merge_strategy: str = Field(default="weighted_geometric", description="路径合并策略: weighted_geometric, max_bonus")
     path_expansion_pruning_threshold: float = Field(default=0.9, description="路径剪枝阈值")
+    path_expansion_beam_width: int = Field(default=100, description="路径扩展束宽（每跳保留的最高分路径数）")
     path_expansion_path_score_weight: float = Field(default=0.50, description="路径分数在最终评分中的权重")
     path_expansion_importance_weight: float = Field(default=0.30, description="重要性在最终评分中的权重")
     path_expansion_recency_weight: float = Field(default=0.20, description="时效性在最终评分中的权重")
@@ -18,11 +18,16 @@ logger = get_logger("individuality")
 class Individuality:
     """个体特征管理类"""
 
+    # 人设文件读取结果的缓存时长（秒），文件只在初始化时写入
+    PERSONALITY_CACHE_TTL = 60.0
+
     def __init__(self):
         self.name = ""
         self.bot_person_id = ""
         self.meta_info_file_path = "data/personality/meta.json"
         self.personality_data_file_path = "data/personality/personality_data.json"
+        self._personality_cache: tuple[str, str] | None = None
+        self._personality_cache_expiry = 0.0
 
         self.model = LLMRequest(model_set=model_config.model_task_config.utils, request_type="individuality.compress")
 
@@ -239,10 +244,21 @@ class Individuality:
         Returns:
             tuple: (personality, identity)
         """
+        now = time.monotonic()
+        if self._personality_cache is not None and now < self._personality_cache_expiry:
+            return self._personality_cache
+
         personality_data = self._load_personality_data()
+        if not personality_data and self._personality_cache is not None:
+            # 文件暂时不可读时沿用上一次的结果，而不是退回默认人设
+            self._personality_cache_expiry = now + self.PERSONALITY_CACHE_TTL
+            return self._personality_cache
+
         personality = personality_data.get("personality", "友好活泼")
         identity = personality_data.get("identity", "人类")
-        return personality, identity
+        self._personality_cache = (personality, identity)
+        self._personality_cache_expiry = now + self.PERSONALITY_CACHE_TTL
+        return self._personality_cache
 
     def _save_personality_to_file(self, personality: str, identity: str):
         """保存personality数据到文件
@@ -258,6 +274,8 @@ class Individuality:
             "last_updated": int(time.time()),
         }
         self._save_personality_data(personality_data)
+        self._personality_cache = (personality, identity)
+        self._personality_cache_expiry = time.monotonic() + self.PERSONALITY_CACHE_TTL
 
     async def _create_personality(self, personality_core: str, personality_side: str) -> str:
         # sourcery skip: merge-list-append, move-assign
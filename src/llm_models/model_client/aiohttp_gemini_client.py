@@ -503,8 +503,11 @@ class AiohttpGeminiClient(BaseClient):
                     },
                 ) as session:
                     if method.upper() == "POST":
+                        # aiohttp 的 json= 走标准库 json.dumps，这里直接用 orjson 编码为 bytes
                         response = await session.post(
-                            url, json=data, headers={"Accept": "text/event-stream" if stream else "application/json"}
+                            url,
+                            data=orjson.dumps(data) if data is not None else None,
+                            headers={"Accept": "text/event-stream" if stream else "application/json"},
                         )
                     else:
                         response = await session.get(url)
@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import importlib.util
 import io
 import re
 from collections.abc import Callable, Coroutine, Iterable
@@ -38,6 +39,9 @@ from .base_client import APIResponse, BaseClient, UsageRecord, client_registry
 
 logger = get_logger("OpenAI客户端")
 
+# httpx 的 HTTP/2 支持依赖可选的 h2 包，未安装时回退到 HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 def _convert_messages(messages: list[Message]) -> list[ChatCompletionMessageParam]:
     """
@@ -440,7 +444,7 @@ class OpenaiClient(BaseClient):
         limits = httpx.Limits(
             max_keepalive_connections=200,  # 保持活跃连接数（原100）
             max_connections=300,  # 最大总连接数（原100）
-            keepalive_expiry=30.0,  # 连接保活时间
+            keepalive_expiry=60.0,  # 连接保活时间（原30s），减少重试/批量生成间隙的重复握手
         )
 
         client = AsyncOpenAI(
@@ -448,7 +452,7 @@ class OpenaiClient(BaseClient):
             api_key=self.api_provider.get_api_key(),
             max_retries=0,
             timeout=self.api_provider.timeout,
-            http_client=httpx.AsyncClient(limits=limits),  # 🔧 自定义连接池配置
+            http_client=httpx.AsyncClient(limits=limits, http2=_HTTP2_AVAILABLE),  # 🔧 自定义连接池配置，可用时启用HTTP/2多路复用
         )
 
         # 存入全局缓存（带事件循环ID）
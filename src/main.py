@@ -268,7 +268,7 @@ class MainSystem:
         # 停止表情管理器
         try:
             cleanup_tasks.append(
-                ("表情管理器", asyncio.get_event_loop().run_in_executor(None, get_emoji_manager().shutdown))
+                ("表情管理器", asyncio.get_running_loop().run_in_executor(None, get_emoji_manager().shutdown))
             )
         except Exception as e:
             logger.error(f"准备停止表情管理器时出错: {e}")
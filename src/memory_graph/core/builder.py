@@ -151,6 +151,10 @@ class MemoryBuilder:
                         "created_at": extracted_params["timestamp"].isoformat(),
                     },
                 },
+                summary=(
+                    f"{extracted_params['subject']} - "
+                    f"{extracted_params['memory_type'].value}: {extracted_params['topic']}"
+                ),
             )
 
             logger.info(
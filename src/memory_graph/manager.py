@@ -212,7 +212,7 @@ class MemoryManager:
             # 2. 执行最后一次维护（保存数据）
             if self.graph_store and self.persistence:
                 logger.info("执行最终数据保存...")
-                await self.persistence.save_graph_store(self.graph_store)
+                await self.persistence.flush(self.graph_store)
 
             # 3. 关闭存储组件
             if self.vector_store:
@@ -1464,19 +1464,8 @@ class MemoryManager:
 
                 for memory, edge, relation in all_new_edges:
                     try:
-                        # 添加到图
-                        self.graph_store.graph.add_edge(
-                            edge.source_id,
-                            edge.target_id,
-                            edge_id=edge.id,
-                            relation=edge.relation,
-                            edge_type=edge.edge_type.value,
-                            importance=edge.importance,
-                            metadata=edge.metadata,
-                        )
-
-                        # 同时添加到记忆的边列表
-                        memory.edges.append(edge)
+                        # 添加到图和记忆的边列表
+                        self.graph_store.add_memory_edge(memory, edge)
 
                         logger.debug(
                             f"✓ {memory.id[:8]} --[{relation['relation_type']}]--> "
@@ -1596,19 +1585,8 @@ class MemoryManager:
                             }
                         )
 
-                        # 添加到图
-                        self.graph_store.graph.add_edge(
-                            edge.source_id,
-                            edge.target_id,
-                            edge_id=edge.id,
-                            relation=edge.relation,
-                            edge_type=edge.edge_type.value,
-                            importance=edge.importance,
-                            metadata=edge.metadata,
-                        )
-
-                        # 同时添加到记忆的边列表
-                        memory.edges.append(edge)
+                        # 添加到图和记忆的边列表
+                        self.graph_store.add_memory_edge(memory, edge)
 
                         result["linked_count"] += 1
 
@@ -2066,18 +2044,8 @@ class MemoryManager:
                             }
                         )
 
-                        # 添加到图
-                        self.graph_store.graph.add_edge(
-                            edge.source_id,
-                            edge.target_id,
-                            edge_id=edge.id,
-                            relation=edge.relation,
-                            edge_type=edge.edge_type.value,
-                            importance=edge.importance,
-                            metadata=edge.metadata,
-                        )
-
-                        memory_a.edges.append(edge)
+                        # 添加到图和记忆的边列表
+                        self.graph_store.add_memory_edge(memory_a, edge)
                         result["linked_count"] += 1
 
                         logger.debug(f"🧠 智能关联: {memory_a.id[:8]} --[{relation_type}]--> {memory_b.id[:8]} (置信度={confidence:.2f})")
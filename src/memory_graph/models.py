@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
@@ -68,6 +69,8 @@ class MemoryNode:
         """后初始化处理"""
         if not self.id:
             self.id = str(uuid.uuid4())
+        # 驻留节点ID：同一ID在图、索引和边中共用一个字符串对象，字典查找走身份比较快路径
+        self.id = sys.intern(self.id)
 
     def to_dict(self) -> dict[str, Any]:
         """转换为字典（用于序列化）"""
@@ -118,6 +121,9 @@ class MemoryEdge:
         """后初始化处理"""
         if not self.id:
             self.id = str(uuid.uuid4())
+        # 驻留端点ID，与节点ID共用同一字符串对象
+        self.source_id = sys.intern(self.source_id)
+        self.target_id = sys.intern(self.target_id)
         # 确保重要性在有效范围内
         self.importance = max(0.0, min(1.0, self.importance))
 
@@ -169,6 +175,8 @@ class Memory:
     access_count: int = 0  # 访问次数
     decay_factor: float = 1.0  # 衰减因子（随时间变化）
     metadata: dict[str, Any] = field(default_factory=dict)  # 扩展元数据
+    summary: str = ""  # 预计算的摘要（构建时生成，检索时直接返回）
+    created_at_ts: float = field(default=0.0, init=False, repr=False, compare=False)  # 创建时间的 UTC 时间戳（秒）
 
     def __post_init__(self):
         """后初始化处理"""
@@ -177,6 +185,11 @@ class Memory:
         # 确保重要性和激活度在有效范围内
         self.importance = max(0.0, min(1.0, self.importance))
         self.activation = max(0.0, min(1.0, self.activation))
+        # 预计算时间戳，检索评分时只需做浮点减法（无时区的时间按 UTC 处理）
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        self.created_at_ts = created_at.timestamp()
 
     def to_dict(self) -> dict[str, Any]:
         """转换为字典（用于序列化）"""
@@ -194,6 +207,7 @@ class Memory:
             "access_count": self.access_count,
             "decay_factor": self.decay_factor,
             "metadata": self.metadata,
+            "summary": self.summary,
         }
 
     @classmethod
@@ -224,6 +238,7 @@ class Memory:
             access_count=data.get("access_count", 0),
             decay_factor=data.get("decay_factor", 1.0),
             metadata=metadata,
+            summary=data.get("summary", ""),
         )
 
     def update_access(self) -> None:
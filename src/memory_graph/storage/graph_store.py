@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import networkx as nx
 
 from src.common.logger import get_logger
@@ -34,6 +36,13 @@ class GraphStore:
         # 索引：节点ID -> 所属记忆ID集合
         self.node_to_memories: dict[str, set[str]] = {}
 
+        # 🚀 邻接索引：节点ID -> {(源, 目标, 类型): 边}，插入时即去重，随增删记忆增量维护
+        self._adjacency: dict[str, dict[tuple, MemoryEdge]] = {}
+        # 同一 (源, 目标, 类型) 可能来自多条记忆，记录全部来源以便精确删除
+        self._edge_owners: dict[tuple, list[MemoryEdge]] = {}
+        self._adjacency_dirty = False  # 节点合并后标记，下次查询时整体重建
+        self.adjacency_version = 0  # 邻接索引每次变化递增，供上层失效排序缓存
+
         logger.info("初始化图存储")
 
     def add_memory(self, memory: Memory) -> None:
@@ -72,6 +81,7 @@ class GraphStore:
                     metadata=edge.metadata,
                     created_at=edge.created_at.isoformat(),
                 )
+                self._index_edge(edge)
 
             # 3. 保存记忆对象
             self.memory_index[memory.id] = memory
@@ -82,6 +92,105 @@ class GraphStore:
             logger.error(f"添加记忆失败: {e}", exc_info=True)
             raise
 
+    def add_edge(self, edge: MemoryEdge) -> None:
+        """
+        添加一条跨记忆的关联边到图
+
+        Args:
+            edge: 要添加的边
+        """
+        self.graph.add_edge(
+            edge.source_id,
+            edge.target_id,
+            edge_id=edge.id,  # 保留边ID，加载时同步到 Memory.edges 才能按ID去重
+            relation=edge.relation,
+            edge_type=edge.edge_type.value,
+            importance=edge.importance,
+            **edge.metadata,
+        )
+
+    def add_memory_edge(self, memory: Memory, edge: MemoryEdge) -> None:
+        """
+        为已有记忆追加一条边（同时写入图、记忆的边列表和邻接索引）
+
+        Args:
+            memory: 边所属的记忆
+            edge: 要添加的边
+        """
+        self.graph.add_edge(
+            edge.source_id,
+            edge.target_id,
+            edge_id=edge.id,
+            relation=edge.relation,
+            edge_type=edge.edge_type.value,
+            importance=edge.importance,
+            metadata=edge.metadata,
+        )
+        memory.edges.append(edge)
+        self._index_edge(edge)
+
+    def _index_edge(self, edge: MemoryEdge) -> None:
+        """将边登记到两个端点的邻接索引（同键后来者覆盖）"""
+        key = (edge.source_id, edge.target_id, edge.edge_type)
+        self._edge_owners.setdefault(key, []).append(edge)
+        self._adjacency.setdefault(edge.source_id, {})[key] = edge
+        self._adjacency.setdefault(edge.target_id, {})[key] = edge
+        self.adjacency_version += 1
+
+    def _unindex_edge(self, edge: MemoryEdge) -> None:
+        """从邻接索引中精确移除一条边（同键仍有其他来源时保留）"""
+        key = (edge.source_id, edge.target_id, edge.edge_type)
+        owners = self._edge_owners.get(key)
+        if not owners:
+            return
+
+        for i, owner in enumerate(owners):
+            if owner is edge:
+                del owners[i]
+                break
+        else:
+            return
+
+        for node_id in (edge.source_id, edge.target_id):
+            node_edges = self._adjacency.get(node_id)
+            if node_edges is None:
+                continue
+            if owners:
+                node_edges[key] = owners[-1]
+            else:
+                node_edges.pop(key, None)
+                if not node_edges:
+                    del self._adjacency[node_id]
+
+        if not owners:
+            del self._edge_owners[key]
+        self.adjacency_version += 1
+
+    def _rebuild_adjacency(self) -> None:
+        """根据所有记忆的边列表重建邻接索引"""
+        self._adjacency = {}
+        self._edge_owners = {}
+        for memory in self.memory_index.values():
+            for edge in memory.edges:
+                self._index_edge(edge)
+        self._adjacency_dirty = False
+        self.adjacency_version += 1
+
+    def get_incident_edges(self, node_id: str) -> list[MemoryEdge]:
+        """
+        获取与节点相连的所有记忆边（出边和入边），O(度数)
+
+        Args:
+            node_id: 节点ID
+
+        Returns:
+            边列表（已按 (源, 目标, 类型) 去重）
+        """
+        if self._adjacency_dirty:
+            self._rebuild_adjacency()
+        node_edges = self._adjacency.get(node_id)
+        return list(node_edges.values()) if node_edges else []
+
     def get_memory_by_id(self, memory_id: str) -> Memory | None:
         """
         根据ID获取记忆
@@ -299,6 +408,9 @@ class GraphStore:
 
             # 4. 删除源节点
             self.graph.remove_node(source_id)
+            # 合并后记忆中的边端点会被改写，索引键随之失效，交给下次查询整体重建
+            self._adjacency_dirty = True
+            self.adjacency_version += 1
 
             logger.info(f"节点合并: {source_id} → {target_id}")
 
@@ -368,13 +480,13 @@ class GraphStore:
 
         # 1. 加载节点
         for node_data in data.get("nodes", []):
-            node_id = node_data.pop("id")
+            node_id = sys.intern(node_data.pop("id"))
             store.graph.add_node(node_id, **node_data)
 
         # 2. 加载边
         for edge_data in data.get("edges", []):
-            source = edge_data.pop("source")
-            target = edge_data.pop("target")
+            source = sys.intern(edge_data.pop("source"))
+            target = sys.intern(edge_data.pop("target"))
             store.graph.add_edge(source, target, **edge_data)
 
         # 3. 加载记忆
@@ -383,7 +495,7 @@ class GraphStore:
 
         # 4. 加载节点到记忆的映射
         for node_id, mem_ids in data.get("node_to_memories", {}).items():
-            store.node_to_memories[node_id] = set(mem_ids)
+            store.node_to_memories[sys.intern(node_id)] = set(mem_ids)
 
         # 5. 同步图中的边到 Memory.edges（保证内存对象和图一致）
         try:
@@ -391,6 +503,9 @@ class GraphStore:
         except Exception:
             logger.exception("同步图边到记忆.edges 失败")
 
+        # 6. 构建邻接索引
+        store._rebuild_adjacency()
+
         logger.info(f"从字典加载图: {store.get_statistics()}")
         return store
 
@@ -407,6 +522,10 @@ class GraphStore:
 
         # 构建快速查重索引：memory_id -> set(edge_id)
         existing_edges = {mid: {e.id for e in mem.edges} for mid, mem in self.memory_index.items()}
+        # 旧数据中的边可能没有ID（同步时会被分配新ID），改按 (源, 目标, 关系) 查重，避免重复同步时越积越多
+        existing_triples = {
+            mid: {(e.source_id, e.target_id, e.relation) for e in mem.edges} for mid, mem in self.memory_index.items()
+        }
 
         for u, v, data in self.graph.edges(data=True):
             # 兼容旧数据：edge_id 可能在 data 中，或叫 id
@@ -436,7 +555,10 @@ class GraphStore:
                     continue
 
                 # 检查是否已存在
-                if edge_dict["id"] and edge_dict["id"] in existing_edges.get(mid, set()):
+                if edge_dict["id"]:
+                    if edge_dict["id"] in existing_edges.get(mid, set()):
+                        continue
+                elif (u, v, edge_dict["relation"]) in existing_triples.get(mid, set()):
                     continue
 
                 try:
@@ -456,6 +578,7 @@ class GraphStore:
 
                 mem.edges.append(mem_edge)
                 existing_edges.setdefault(mid, set()).add(mem_edge.id)
+                existing_triples.setdefault(mid, set()).add((u, v, edge_dict["relation"]))
 
         logger.info("已将图中的边同步到 Memory.edges（保证 graph 与 memory 对象一致）")
 
@@ -491,7 +614,9 @@ class GraphStore:
                                 self.graph.remove_node(node.id)
                             del self.node_to_memories[node.id]
 
-            # 3. 从记忆索引中移除
+            # 3. 从邻接索引和记忆索引中移除
+            for edge in memory.edges:
+                self._unindex_edge(edge)
             del self.memory_index[memory_id]
 
             logger.debug(f"成功删除记忆: {memory_id}")
@@ -506,4 +631,8 @@ class GraphStore:
         self.graph.clear()
         self.memory_index.clear()
         self.node_to_memories.clear()
+        self._adjacency.clear()
+        self._edge_owners.clear()
+        self._adjacency_dirty = False
+        self.adjacency_version += 1
         logger.warning("图存储已清空")
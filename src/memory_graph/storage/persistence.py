@@ -16,7 +16,7 @@ import aiofiles
 import orjson
 
 from src.common.logger import get_logger
-from src.memory_graph.models import StagedMemory
+from src.memory_graph.models import Memory, MemoryEdge, StagedMemory
 from src.memory_graph.storage.graph_store import GraphStore
 
 logger = get_logger(__name__)
@@ -137,7 +137,9 @@ class PersistenceManager:
         data_dir: Path,
         graph_file_name: str = "memory_graph.json",
         staged_file_name: str = "staged_memories.json",
+        journal_file_name: str = "memory_graph.journal.jsonl",
         auto_save_interval: int = 300,  # 自动保存间隔（秒）
+        journal_compact_threshold: int = 200,  # 增量日志条数达到该值后触发全量快照
     ):
         """
         初始化持久化管理器
@@ -146,13 +148,16 @@ class PersistenceManager:
             data_dir: 数据存储目录
             graph_file_name: 图数据文件名
             staged_file_name: 临时记忆文件名
+            journal_file_name: 增量日志文件名（追加写入新增的记忆和边）
             auto_save_interval: 自动保存间隔（秒）
+            journal_compact_threshold: 增量日志压缩阈值（条数）
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         self.graph_file = self.data_dir / graph_file_name
         self.staged_file = self.data_dir / staged_file_name
+        self.journal_file = self.data_dir / journal_file_name
         self.backup_dir = self.data_dir / "backups"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
@@ -161,6 +166,10 @@ class PersistenceManager:
         self._running = False
         self._file_lock = asyncio.Lock()  # 文件操作锁
 
+        # 增量日志：记录自上次全量快照以来追加的条目数
+        self.journal_compact_threshold = journal_compact_threshold
+        self._journal_entries = 0
+
         logger.info(f"初始化持久化管理器: data_dir={data_dir}")
 
     async def save_graph_store(self, graph_store: GraphStore) -> None:
@@ -196,6 +205,9 @@ class PersistenceManager:
                 # 使用安全的原子写入
                 await safe_atomic_write(temp_file, self.graph_file)
 
+                # 快照已包含所有增量，清空增量日志
+                self._truncate_journal()
+
                 logger.debug(f"图数据已保存: {self.graph_file}, 大小: {len(json_data) / 1024:.2f} KB")
 
             except Exception as e:
@@ -210,8 +222,15 @@ class PersistenceManager:
             GraphStore 对象，如果文件不存在则返回 None
         """
         if not self.graph_file.exists():
-            logger.info("图数据文件不存在，返回空图")
-            return None
+            if not self.journal_file.exists():
+                logger.info("图数据文件不存在，返回空图")
+                return None
+
+            # 只有增量日志（首次快照前退出），从空图回放
+            async with self._file_lock:
+                graph_store = GraphStore()
+                await self._replay_journal(graph_store)
+                return graph_store
 
         async with self._file_lock:  # 使用文件锁防止并发访问
             try:
@@ -241,6 +260,9 @@ class PersistenceManager:
                 # 恢复图存储
                 graph_store = GraphStore.from_dict(data)
 
+                # 回放快照之后追加的增量日志
+                await self._replay_journal(graph_store)
+
                 logger.info(f"图数据加载完成: {graph_store.get_statistics()}")
                 return graph_store
 
@@ -249,6 +271,98 @@ class PersistenceManager:
                 # 尝试加载备份
                 return await self._load_from_backup()
 
+    async def save_delta(self, memory: Memory | None = None, edge: MemoryEdge | None = None) -> None:
+        """
+        将新增的记忆或边追加写入增量日志
+
+        只写入本次新增的数据，避免每次工具调用都全量序列化整张图。
+        全量快照由 save_graph_store 负责，快照成功后日志会被清空。
+
+        Args:
+            memory: 新增的记忆（可选）
+            edge: 新增的关联边（可选）
+        """
+        lines = []
+        if memory is not None:
+            lines.append(orjson.dumps({"op": "memory", "data": memory.to_dict()}, option=orjson.OPT_SERIALIZE_NUMPY))
+        if edge is not None:
+            lines.append(orjson.dumps({"op": "edge", "data": edge.to_dict()}, option=orjson.OPT_SERIALIZE_NUMPY))
+        if not lines:
+            return
+
+        async with self._file_lock:  # 与全量快照互斥，避免日志在截断时被写入
+            try:
+                async with aiofiles.open(self.journal_file, "ab") as f:
+                    await f.write(b"\n".join(lines) + b"\n")
+                self._journal_entries += len(lines)
+                logger.debug(f"增量日志已追加: {len(lines)} 条 (累计 {self._journal_entries} 条)")
+
+            except Exception as e:
+                logger.error(f"追加增量日志失败: {e}", exc_info=True)
+                raise
+
+    def needs_compaction(self) -> bool:
+        """增量日志是否已达到压缩阈值（需要重写全量快照）"""
+        return self._journal_entries >= self.journal_compact_threshold
+
+    async def flush(self, graph_store: GraphStore) -> None:
+        """
+        将图数据完整落盘并压缩增量日志（用于正常关闭）
+
+        Args:
+            graph_store: 图存储对象
+        """
+        await self.save_graph_store(graph_store)
+
+    def _truncate_journal(self) -> None:
+        """清空增量日志（调用方需持有文件锁）"""
+        try:
+            self.journal_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"清空增量日志失败: {e}")
+            return
+        self._journal_entries = 0
+
+    async def _replay_journal(self, graph_store: GraphStore) -> None:
+        """
+        将增量日志回放到图存储（调用方需持有文件锁）
+
+        Args:
+            graph_store: 已从快照恢复的图存储对象
+        """
+        if not self.journal_file.exists():
+            return
+
+        async with aiofiles.open(self.journal_file, "rb") as f:
+            content = await f.read()
+
+        replayed = 0
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = orjson.loads(line)
+                if entry["op"] == "memory":
+                    memory = Memory.from_dict(entry["data"])
+                    graph_store.add_memory(memory)
+                    # 复用的已有节点其 memory_ids 元数据可能已更新
+                    for node in memory.nodes:
+                        graph_store.graph.nodes[node.id]["metadata"] = node.metadata
+                elif entry["op"] == "edge":
+                    graph_store.add_edge(MemoryEdge.from_dict(entry["data"]))
+                replayed += 1
+            except Exception as e:
+                # 最后一行可能因异常退出而不完整，跳过即可
+                logger.warning(f"跳过无法解析的增量日志条目: {e}")
+
+        if replayed:
+            # 回放的关联边只写入了图，与快照加载保持一致：同步到 Memory.edges 并重建邻接索引
+            graph_store._sync_memory_edges_from_graph()
+            graph_store._rebuild_adjacency()
+
+        self._journal_entries = replayed
+        logger.info(f"增量日志回放完成: {replayed} 条")
+
     async def save_staged_memories(self, staged_memories: list[StagedMemory]) -> None:
         """
         保存临时记忆列表
@@ -47,6 +47,12 @@ class VectorStore:
         self.collection = None
         self.embedding_function = embedding_function
 
+        # 🚀 内存中的 L2 归一化向量矩阵（float32, 连续存储），用于批量相似度计算
+        self._norm_matrix: np.ndarray | None = None
+        self._id_to_row: dict[str, int] = {}
+        self._free_rows: list[int] = []  # 删除节点后可复用的行
+        self._row_count = 0  # 已分配的行数
+
         logger.info(f"初始化向量存储: collection={collection_name}, dir={self.data_dir}")
 
     async def initialize(self) -> None:
@@ -114,6 +120,7 @@ class VectorStore:
                 metadatas=[metadata],
                 documents=[node.content],  # 文本内容用于检索
             )
+            self._index_embedding(node.id, node.embedding)
 
             logger.debug(f"添加节点到向量存储: {node}")
 
@@ -163,6 +170,8 @@ class VectorStore:
                 metadatas=metadatas,
                 documents=[n.content for n in valid_nodes],
             )
+            for n in valid_nodes:
+                self._index_embedding(n.id, n.embedding)
 
             logger.info(f"批量添加 {len(valid_nodes)} 个节点到向量存储")
 
@@ -377,11 +386,14 @@ class VectorStore:
                 if ids is not None and len(ids) > 0:
                     metadatas = result.get("metadatas")
                     embeddings = result.get("embeddings")
+                    embedding = np.array(embeddings[0]) if embeddings is not None and len(embeddings) > 0 and embeddings[0] is not None else None
+                    if embedding is not None:
+                        self._index_embedding(ids[0], embedding)
 
                     return {
                         "id": ids[0],
                         "metadata": metadatas[0] if metadatas is not None and len(metadatas) > 0 else {},
-                        "embedding": np.array(embeddings[0]) if embeddings is not None and len(embeddings) > 0 and embeddings[0] is not None else None,
+                        "embedding": embedding,
                     }
 
             return None
@@ -390,6 +402,56 @@ class VectorStore:
             logger.error(f"获取节点失败: {e}", exc_info=True)
             return None
 
+    async def get_nodes_batch(self, node_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        批量获取节点数据（一次多键查询代替多次 get_node_by_id）
+
+        Args:
+            node_ids: 节点ID列表
+
+        Returns:
+            {node_id: 节点数据}，不存在的节点不会出现在结果中
+        """
+        if not self.collection:
+            raise RuntimeError("向量存储未初始化")
+
+        if not node_ids:
+            return {}
+
+        try:
+            result = self.collection.get(ids=list(node_ids), include=["metadatas", "embeddings"])
+
+            nodes: dict[str, dict[str, Any]] = {}
+            if result is None:
+                return nodes
+
+            ids = result.get("ids")
+            if ids is None or len(ids) == 0:
+                return nodes
+
+            metadatas = result.get("metadatas")
+            embeddings = result.get("embeddings")
+            has_metadatas = metadatas is not None and len(metadatas) == len(ids)
+            has_embeddings = embeddings is not None and len(embeddings) == len(ids)
+
+            for i, node_id in enumerate(ids):
+                embedding = None
+                if has_embeddings and embeddings[i] is not None:
+                    embedding = np.array(embeddings[i])
+                    self._index_embedding(node_id, embedding)
+
+                nodes[node_id] = {
+                    "id": node_id,
+                    "metadata": (metadatas[i] or {}) if has_metadatas else {},
+                    "embedding": embedding,
+                }
+
+            return nodes
+
+        except Exception as e:
+            logger.error(f"批量获取节点失败: {e}", exc_info=True)
+            return {}
+
     async def delete_node(self, node_id: str) -> None:
         """
         删除节点
@@ -402,6 +464,7 @@ class VectorStore:
 
         try:
             self.collection.delete(ids=[node_id])
+            self._unindex_embedding(node_id)
             logger.debug(f"删除节点: {node_id}")
 
         except Exception as e:
@@ -421,12 +484,86 @@ class VectorStore:
 
         try:
             self.collection.update(ids=[node_id], embeddings=[embedding.tolist()])
+            self._index_embedding(node_id, embedding)
             logger.debug(f"更新节点 embedding: {node_id}")
 
         except Exception as e:
             logger.error(f"更新节点 embedding 失败: {e}", exc_info=True)
             raise
 
+    def batch_similarity(self, query_embedding: np.ndarray, node_ids: list[str]) -> dict[str, float]:
+        """
+        批量计算查询向量与已索引节点的余弦相似度
+
+        使用内存中的归一化矩阵，一次矩阵-向量乘法得到所有相似度。
+        未被索引的节点不会出现在结果中，调用方需要自行回退。
+
+        Args:
+            query_embedding: 查询向量
+            node_ids: 节点ID列表
+
+        Returns:
+            {node_id: similarity}，相似度限制在 [0, 1]
+        """
+        if self._norm_matrix is None:
+            return {}
+
+        id_to_row = self._id_to_row
+        hit_ids = [nid for nid in node_ids if nid in id_to_row]
+        if not hit_ids:
+            return {}
+
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        if query.shape[0] != self._norm_matrix.shape[1]:
+            return {}
+
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            return dict.fromkeys(hit_ids, 0.0)
+
+        rows = np.fromiter((id_to_row[nid] for nid in hit_ids), dtype=np.intp, count=len(hit_ids))
+        similarities = self._norm_matrix[rows] @ (query / query_norm)
+        np.clip(similarities, 0.0, 1.0, out=similarities)
+
+        return dict(zip(hit_ids, similarities.tolist()))
+
+    def _index_embedding(self, node_id: str, embedding: np.ndarray) -> None:
+        """将节点向量归一化后写入内存矩阵（已存在则覆盖）"""
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        if norm == 0:
+            self._unindex_embedding(node_id)
+            return
+
+        if self._norm_matrix is None:
+            self._norm_matrix = np.zeros((64, vec.shape[0]), dtype=np.float32)
+        elif vec.shape[0] != self._norm_matrix.shape[1]:
+            # 维度不一致（如更换了嵌入模型），不进入矩阵，由调用方回退到逐个计算
+            self._unindex_embedding(node_id)
+            return
+
+        row = self._id_to_row.get(node_id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = self._row_count
+                self._row_count += 1
+                if row >= self._norm_matrix.shape[0]:
+                    # 容量翻倍，摊还 O(1) 插入
+                    grown = np.zeros((self._norm_matrix.shape[0] * 2, self._norm_matrix.shape[1]), dtype=np.float32)
+                    grown[: self._norm_matrix.shape[0]] = self._norm_matrix
+                    self._norm_matrix = grown
+            self._id_to_row[node_id] = row
+
+        self._norm_matrix[row] = vec / norm
+
+    def _unindex_embedding(self, node_id: str) -> None:
+        """从内存矩阵中移除节点"""
+        row = self._id_to_row.pop(node_id, None)
+        if row is not None:
+            self._free_rows.append(row)
+
     def get_total_count(self) -> int:
         """获取向量存储中的节点总数"""
         if not self.collection:
@@ -445,6 +582,10 @@ class VectorStore:
                 name=self.collection_name,
                 metadata={"description": "Memory graph node embeddings"},
             )
+            self._norm_matrix = None
+            self._id_to_row.clear()
+            self._free_rows.clear()
+            self._row_count = 0
             logger.warning(f"向量存储已清空: {self.collection_name}")
 
         except Exception as e:
@@ -11,7 +11,7 @@ from src.common.logger import get_logger
 from src.config.config import global_config
 from src.memory_graph.core.builder import MemoryBuilder
 from src.memory_graph.core.extractor import MemoryExtractor
-from src.memory_graph.models import Memory
+from src.memory_graph.models import Memory, MemoryEdge
 from src.memory_graph.storage.graph_store import GraphStore
 from src.memory_graph.storage.persistence import PersistenceManager
 from src.memory_graph.storage.vector_store import VectorStore
@@ -377,8 +377,8 @@ class MemoryTools:
             # 3. 添加到存储（暂存状态）
             await self._add_memory_to_stores(memory)
 
-            # 4. 异步保存到磁盘（不阻塞当前操作）
-            asyncio.create_task(self._async_save_graph_store())
+            # 4. 异步追加到增量日志（不阻塞当前操作）
+            asyncio.create_task(self._async_save_delta(memory=memory))
 
             logger.info(f"记忆创建成功: {memory.id}")
 
@@ -448,17 +448,10 @@ class MemoryTools:
             )
 
             # 4. 添加边到图存储
-            self.graph_store.graph.add_edge(
-                edge.source_id,
-                edge.target_id,
-                relation=edge.relation,
-                edge_type=edge.edge_type.value,
-                importance=edge.importance,
-                **edge.metadata
-            )
+            self.graph_store.add_edge(edge)
 
-            # 5. 异步保存（不阻塞当前操作）
-            asyncio.create_task(self._async_save_graph_store())
+            # 5. 异步追加到增量日志（不阻塞当前操作）
+            asyncio.create_task(self._async_save_delta(edge=edge))
 
             logger.info(f"记忆关联成功: {source_memory.id} -> {target_memory.id}")
 
@@ -596,6 +589,7 @@ class MemoryTools:
                                 max_branches_per_node=getattr(global_config.memory, "path_expansion_max_branches", 10),
                                 path_merge_strategy=getattr(global_config.memory, "path_expansion_merge_strategy", "weighted_geometric"),
                                 pruning_threshold=getattr(global_config.memory, "path_expansion_pruning_threshold", 0.9),
+                                beam_width=getattr(global_config.memory, "path_expansion_beam_width", 100),
                                 final_scoring_weights={
                                     "path_score": getattr(global_config.memory, "path_expansion_path_score_weight", 0.50),
                                     "importance": getattr(global_config.memory, "path_expansion_importance_weight", 0.30),
@@ -854,7 +848,7 @@ class MemoryTools:
                     "memory_id": memory.id,
                     "importance": memory.importance,
                     "created_at": memory.created_at.isoformat(),
-                    "summary": self._summarize_memory(memory),
+                    "summary": memory.summary or self._summarize_memory(memory),
                     "score": round(score, 4),  # 🆕 暴露最终分数，便于调试
                     "dominant_node_type": node_type,  # 🆕 暴露节点类型
                 }
@@ -1291,7 +1285,7 @@ class MemoryTools:
         return None
 
     def _summarize_memory(self, memory: Memory) -> str:
-        """生成记忆摘要"""
+        """生成记忆摘要（兼容没有预计算摘要的旧记忆）"""
         if not memory.metadata:
             return "未知记忆"
 
@@ -1335,3 +1329,25 @@ class MemoryTools:
             logger.debug("异步保存图数据成功")
         except Exception as e:
             logger.error(f"异步保存图数据失败: {e}", exc_info=True)
+
+    async def _async_save_delta(self, memory: Memory | None = None, edge: MemoryEdge | None = None) -> None:
+        """
+        异步将新增的记忆/边追加到增量日志
+
+        日志积累到阈值后改为写一次全量快照（同时清空日志）
+
+        Args:
+            memory: 新增的记忆（可选）
+            edge: 新增的关联边（可选）
+        """
+        try:
+            if self.persistence_manager is None:
+                logger.warning("持久化管理器未初始化，跳过增量保存")
+                return
+
+            await self.persistence_manager.save_delta(memory=memory, edge=edge)
+
+            if self.persistence_manager.needs_compaction():
+                await self._async_save_graph_store()
+        except Exception as e:
+            logger.error(f"增量保存图数据失败: {e}", exc_info=True)
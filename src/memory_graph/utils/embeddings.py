@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import numpy as np
 
 from src.common.logger import get_logger
@@ -30,15 +32,21 @@ class EmbeddingGenerator:
     def __init__(
         self,
         use_api: bool = True,
+        cache_size: int = 1024,
     ):
         """
         初始化嵌入生成器
 
         Args:
             use_api: 是否使用 API（默认 True）
+            cache_size: 查询文本嵌入的 LRU 缓存容量（0 表示禁用）
         """
         self.use_api = use_api
 
+        # LRU 缓存：规范化文本 -> 只读嵌入向量（相同描述无需重复请求 API）
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
         # API 相关
         self._llm_request = None
         self._api_available = False
@@ -89,11 +97,18 @@ class EmbeddingGenerator:
             logger.debug("输入文本为空，返回 None")
             return None
 
+        cache_key = self._normalize_cache_key(text)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
         try:
             # 使用 API 生成嵌入
             if self.use_api:
                 embedding = await self._generate_with_api(text)
                 if embedding is not None:
+                    self._store_in_cache(cache_key, embedding)
                     return embedding
 
             # API 失败，记录日志并返回 None
@@ -104,6 +119,21 @@ class EmbeddingGenerator:
             logger.error(f"❌ 嵌入生成异常: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _normalize_cache_key(text: str) -> str:
+        """规范化缓存键（小写 + 合并空白）"""
+        return " ".join(text.lower().split())
+
+    def _store_in_cache(self, key: str, embedding: np.ndarray) -> None:
+        """写入 LRU 缓存，命中时直接返回同一对象，因此设为只读防止被调用方修改"""
+        if self._cache_size <= 0:
+            return
+        embedding.setflags(write=False)
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     async def _generate_with_api(self, text: str) -> np.ndarray | None:
         """使用 API 生成嵌入"""
         try:
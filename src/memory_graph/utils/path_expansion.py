@@ -14,18 +14,18 @@
 - 多维度最终评分
 """
 
-import asyncio
+import heapq
+import sys
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from src.common.logger import get_logger
 from src.memory_graph.utils.similarity import cosine_similarity
 
 if TYPE_CHECKING:
-    import numpy as np
-
     from src.memory_graph.models import Memory
     from src.memory_graph.storage.graph_store import GraphStore
     from src.memory_graph.storage.vector_store import VectorStore
@@ -33,29 +33,76 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
 class Path:
-    """表示一条路径"""
+    """
+    表示一条路径
+
+    🚀 采用父指针表示：每条路径只存叶子节点和到达它的边，
+    分叉时不再复制整条节点/边列表，完整序列按需沿 parent 回溯重建。
+    使用 __slots__，避免大量临时路径各自携带 __dict__。
+    """
+
+    __slots__ = ("_hash", "depth", "edge", "leaf", "parent", "score")
+
+    def __init__(
+        self,
+        leaf: str | None = None,
+        edge: Any = None,
+        score: float = 0.0,
+        depth: int = 0,
+        parent: "Path | None" = None,
+    ):
+        self.leaf = leaf  # 叶子节点ID（路径终点）
+        self.edge = edge  # 从父路径叶子到本路径叶子的边（初始路径为 None）
+        self.score = score  # 当前路径分数
+        self.depth = depth  # 路径深度
+        self.parent = parent  # 父路径（用于追踪）
+        # 增量哈希：(父路径哈希, 叶子节点)，无需构造节点元组；路径创建后节点序列不再变化
+        self._hash = hash((parent._hash if parent is not None else 0, leaf))
 
-    nodes: list[str] = field(default_factory=list)  # 节点ID序列
-    edges: list[Any] = field(default_factory=list)  # 边序列
-    score: float = 0.0  # 当前路径分数
-    depth: int = 0  # 路径深度
-    parent: "Path | None" = None  # 父路径（用于追踪）
-    is_merged: bool = False  # 是否为合并路径
-    merged_from: list["Path"] = field(default_factory=list)  # 合并来源路径
+    def __repr__(self) -> str:
+        return f"Path(nodes={self.nodes}, score={self.score:.3f}, depth={self.depth})"
 
     def __hash__(self):
         """使路径可哈希（基于节点序列）"""
-        return hash(tuple(self.nodes))
+        return self._hash
+
+    @property
+    def nodes(self) -> list[str]:
+        """节点ID序列（沿父指针回溯重建）"""
+        nodes = []
+        path = self
+        while path is not None:
+            if path.leaf is not None:
+                nodes.append(path.leaf)
+            path = path.parent
+        nodes.reverse()
+        return nodes
+
+    @property
+    def edges(self) -> list[Any]:
+        """边序列（沿父指针回溯重建）"""
+        edges = []
+        path = self
+        while path is not None:
+            if path.edge is not None:
+                edges.append(path.edge)
+            path = path.parent
+        edges.reverse()
+        return edges
 
     def get_leaf_node(self) -> str | None:
         """获取叶子节点（路径终点）"""
-        return self.nodes[-1] if self.nodes else None
+        return self.leaf
 
     def contains_node(self, node_id: str) -> bool:
         """检查路径是否包含某个节点"""
-        return node_id in self.nodes
+        path = self
+        while path is not None:
+            if path.leaf == node_id:
+                return True
+            path = path.parent
+        return False
 
 
 @dataclass
@@ -69,8 +116,8 @@ class PathExpansionConfig:
     pruning_threshold: float = 0.9  # 剪枝阈值（新路径分数需达到已有路径的90%）
     high_score_threshold: float = 0.7  # 高分路径阈值
     medium_score_threshold: float = 0.4  # 中分路径阈值
-    max_active_paths: int = 1000  # 最大活跃路径数（防止爆炸）
-    top_paths_retain: int = 500  # 超限时保留的top路径数
+    beam_width: int = 100  # 束宽：每跳只保留分数最高的 b 条路径
+    beam_threshold_lambda: float = 0.9  # 束阈值 τ = λ·min + (1-λ)·max（λ=1 时不做阈值剪枝）
     
     # 🚀 性能优化参数
     enable_early_stop: bool = True  # 启用早停（如果路径增长很少则提前结束）
@@ -99,6 +146,14 @@ class PathExpansionConfig:
         }
     )
 
+    def __post_init__(self):
+        # 🚀 预计算三档分叉数，_calculate_max_branches 只需两次比较
+        self._branches_high = int(self.max_branches_per_node * 1.5)  # 高分路径多探索
+        self._branches_med = self.max_branches_per_node
+        self._branches_low = int(self.max_branches_per_node * 0.5)  # 低分路径少探索
+        # 🚀 预计算各深度的衰减因子，深度不超过 max_hops
+        self._decay_table = [self.damping_factor**d for d in range(self.max_hops + 2)]
+
 
 class PathScoreExpansion:
     """路径评分扩展算法实现"""
@@ -122,9 +177,15 @@ class PathScoreExpansion:
         self.config = config or PathExpansionConfig()
         self.prefer_node_types: list[str] = []  # 🆕 偏好节点类型
         
-        # 🚀 性能优化：邻居边缓存
+        # 🚀 排序后的邻居边缓存：跨查询复用，图存储邻接索引变化（版本号改变）时才失效
         self._neighbor_cache: dict[str, list[Any]] = {}
+        self._neighbor_cache_version = -1
+
+        # 🚀 性能优化：单次查询内的缓存（跨跳、跨分支复用）
         self._node_score_cache: dict[str, float] = {}
+        self._node_data_cache: dict[str, dict[str, Any] | None] = {}
+        self._prefer_match_cache: dict[str, bool] = {}
+        self._edge_weight_cache: dict[tuple[str, str, Any], float] = {}
 
         logger.info(
             f"PathScoreExpansion 初始化: max_hops={self.config.max_hops}, "
@@ -158,20 +219,30 @@ class PathScoreExpansion:
             return []
 
         # 🚀 清空缓存（每次查询重新开始）
-        self._neighbor_cache.clear()
+        if self._neighbor_cache_version != self.graph_store.adjacency_version:
+            self._neighbor_cache.clear()
+            self._neighbor_cache_version = self.graph_store.adjacency_version
         self._node_score_cache.clear()
+        self._node_data_cache.clear()
+        self._prefer_match_cache.clear()
+        self._edge_weight_cache.clear()
 
         # 保存偏好类型
         self.prefer_node_types = prefer_node_types or []
         if self.prefer_node_types:
             logger.info(f"🎯 偏好节点类型: {self.prefer_node_types}")
 
+        # 🚀 热循环中反复读取配置，绑定为局部变量省去属性查找
+        cfg = self.config
+
         # 1. 初始化路径
         active_paths = []
         best_score_to_node: dict[str, float] = {}  # 记录每个节点的最佳到达分数
 
         for node_id, score, metadata in initial_nodes:
-            path = Path(nodes=[node_id], edges=[], score=score, depth=0)
+            # 驻留初始节点ID（来自向量检索结果），与图中的ID共用同一字符串对象
+            node_id = sys.intern(node_id)
+            path = Path(leaf=node_id, score=score, depth=0)
             active_paths.append(path)
             best_score_to_node[node_id] = score
 
@@ -180,9 +251,8 @@ class PathScoreExpansion:
         # 2. 多跳扩展
         hop_stats = []  # 每跳统计信息
 
-        for hop in range(self.config.max_hops):
+        for hop in range(cfg.max_hops):
             hop_start = time.time()
-            next_paths = []
             branches_created = 0
             paths_merged = 0
             paths_pruned = 0
@@ -191,35 +261,11 @@ class PathScoreExpansion:
             candidate_nodes_for_batch = set()
             path_candidates: list[tuple[Path, Any, str, float]] = []  # (path, edge, next_node, edge_weight)
 
-            # 第一阶段：收集所有候选节点
+            # 第一阶段：收集所有候选节点（邻接查询走内存索引，顺序执行即可）
             for path in active_paths:
-                current_node = path.get_leaf_node()
-                if not current_node:
-                    continue
-
-                # 获取排序后的邻居边
-                neighbor_edges = await self._get_sorted_neighbor_edges(current_node)
-
-                # 动态计算最大分叉数
-                max_branches = self._calculate_max_branches(path.score)
-                branch_count = 0
-
-                for edge in neighbor_edges[:max_branches]:
-                    next_node = edge.target_id if edge.source_id == current_node else edge.source_id
-
-                    # 避免环路
-                    if path.contains_node(next_node):
-                        continue
-
-                    edge_weight = self._get_edge_weight(edge)
-                    
-                    # 记录候选
-                    path_candidates.append((path, edge, next_node, edge_weight))
-                    candidate_nodes_for_batch.add(next_node)
-                    
-                    branch_count += 1
-                    if branch_count >= max_branches:
-                        break
+                for candidate in self._expand_one(path):
+                    path_candidates.append(candidate)
+                    candidate_nodes_for_batch.add(candidate[2])
 
             # 🚀 第二阶段：批量计算所有候选节点的分数
             if candidate_nodes_for_batch:
@@ -229,65 +275,99 @@ class PathScoreExpansion:
             else:
                 batch_node_scores = {}
 
-            # 🚀 第三阶段：使用批量计算的分数创建路径
-            for path, edge, next_node, edge_weight in path_candidates:
-                node_score = batch_node_scores.get(next_node, 0.3)
+            # 🚀 第三阶段：束搜索，用大小为 beam_width 的最小堆只保留本跳 top-b 条路径
+            beam_width = cfg.beam_width
+            pruning_threshold = cfg.pruning_threshold
+            beam: list[tuple[float, int, Path]] = []  # (score, seq, path)，seq 保证堆比较不会落到 Path 上
+            endpoint_index: dict[str, tuple[int, Path]] = {}  # 叶子节点 -> 束内未合并路径 (seq, path)
+
+            # 🚀 向量化计算本跳全部候选的新分数
+            candidate_count = len(path_candidates)
+            new_scores = self._calculate_path_score(
+                old_score=np.fromiter((c[0].score for c in path_candidates), dtype=float, count=candidate_count),
+                edge_weight=np.fromiter((c[3] for c in path_candidates), dtype=float, count=candidate_count),
+                node_score=np.fromiter(
+                    (batch_node_scores.get(c[2], 0.3) for c in path_candidates), dtype=float, count=candidate_count
+                ),
+                depth=hop + 1,
+            )
 
-                new_score = self._calculate_path_score(
-                    old_score=path.score,
-                    edge_weight=edge_weight,
-                    node_score=node_score,
-                    depth=hop + 1,
+            # 🚀 向量化预筛：束阈值 τ 与本跳开始时的最优到达分数剪枝一次比较完成
+            # 最优分数在本跳内只增不减，预筛掉的候选在逐个检查时同样会被剪掉
+            surviving = np.arange(candidate_count)
+            if candidate_count:
+                lam = cfg.beam_threshold_lambda
+                tau = lam * new_scores.min() + (1 - lam) * new_scores.max()
+                best_scores = np.fromiter(
+                    (best_score_to_node.get(c[2], 0.0) for c in path_candidates), dtype=float, count=candidate_count
                 )
+                keep_mask = (new_scores >= tau) & (new_scores >= best_scores * pruning_threshold)
+                surviving = np.flatnonzero(keep_mask)
+                paths_pruned += candidate_count - len(surviving)
 
-                # 剪枝：如果到达该节点的分数远低于已有最优路径，跳过
+            for seq, new_score in zip(surviving.tolist(), new_scores[surviving].tolist()):
+                path, edge, next_node, _ = path_candidates[seq]
+
+                # 剪枝：如果到达该节点的分数远低于已有最优路径（含本跳已更新的），跳过
                 if next_node in best_score_to_node:
-                    if new_score < best_score_to_node[next_node] * self.config.pruning_threshold:
+                    if new_score < best_score_to_node[next_node] * pruning_threshold:
                         paths_pruned += 1
                         continue
 
+                # 束已满且不优于束内最差路径，跳过
+                if len(beam) >= beam_width and new_score <= beam[0][0]:
+                    paths_pruned += 1
+                    continue
+
                 # 更新最佳分数
                 best_score_to_node[next_node] = max(best_score_to_node.get(next_node, 0), new_score)
 
                 # 创建新路径
                 new_path = Path(
-                    nodes=path.nodes + [next_node],
-                    edges=path.edges + [edge],
+                    leaf=next_node,
+                    edge=edge,
                     score=new_score,
                     depth=hop + 1,
                     parent=path,
                 )
 
                 # 尝试路径合并
-                merged_path = self._try_merge_paths(new_path, next_paths)
+                hit = endpoint_index.get(next_node)
+                merged_path = self._try_merge_paths(new_path, endpoint_index)
                 if merged_path:
-                    next_paths.append(merged_path)
+                    new_path = merged_path
                     paths_merged += 1
+                    # 被合并的路径立即移出束，不再占用束宽
+                    self._remove_beam_entry(beam, hit[0])
+                else:
+                    endpoint_index[next_node] = (seq, new_path)
+
+                entry = (new_path.score, seq, new_path)
+                if len(beam) < beam_width:
+                    heapq.heappush(beam, entry)
                 else:
-                    next_paths.append(new_path)
+                    _, evicted_seq, evicted = heapq.heappushpop(beam, entry)
+                    # 被挤出束的路径不能再参与合并
+                    evicted_leaf = evicted.get_leaf_node()
+                    if endpoint_index.get(evicted_leaf, (None,))[0] == evicted_seq:
+                        del endpoint_index[evicted_leaf]
 
                 branches_created += 1
 
-            # 路径数量控制：如果爆炸性增长，保留高分路径
-            if len(next_paths) > self.config.max_active_paths:
-                logger.warning(
-                    f"⚠️  路径数量超限 ({len(next_paths)} > {self.config.max_active_paths})，"
-                    f"保留 top {self.config.top_paths_retain}"
-                )
-                next_paths = sorted(next_paths, key=lambda p: p.score, reverse=True)[
-                    : self.config.top_paths_retain
-                ]
+            # 按候选生成顺序输出，保证下一跳的剪枝顺序与束外行为一致
+            beam.sort(key=lambda entry: entry[1])
+            next_paths = [p for _, _, p in beam]
 
             # 🚀 早停检测：如果路径增长很少，提前终止
             prev_path_count = len(active_paths)
             active_paths = next_paths
             
-            if self.config.enable_early_stop and prev_path_count > 0:
+            if cfg.enable_early_stop and prev_path_count > 0:
                 growth_rate = (len(active_paths) - prev_path_count) / prev_path_count
-                if growth_rate < self.config.early_stop_growth_threshold:
+                if growth_rate < cfg.early_stop_growth_threshold:
                     logger.info(
-                        f"⏸️  早停触发: 路径增长率 {growth_rate:.2%} < {self.config.early_stop_growth_threshold:.0%}, "
-                        f"在第 {hop+1}/{self.config.max_hops} 跳停止"
+                        f"⏸️  早停触发: 路径增长率 {growth_rate:.2%} < {cfg.early_stop_growth_threshold:.0%}, "
+                        f"在第 {hop+1}/{cfg.max_hops} 跳停止"
                     )
                     hop_time = time.time() - hop_start
                     hop_stats.append(
@@ -316,7 +396,7 @@ class PathScoreExpansion:
             )
 
             logger.debug(
-                f"  Hop {hop+1}/{self.config.max_hops}: "
+                f"  Hop {hop+1}/{cfg.max_hops}: "
                 f"{len(active_paths)} 条路径, "
                 f"{branches_created} 分叉, "
                 f"{paths_merged} 合并, "
@@ -338,7 +418,7 @@ class PathScoreExpansion:
         logger.info(f"🔗 映射到 {len(memory_paths)} 条候选记忆")
 
         # 🚀 4.5. 粗排过滤：在详细评分前过滤掉低质量记忆
-        if len(memory_paths) > self.config.max_candidate_memories:
+        if len(memory_paths) > cfg.max_candidate_memories:
             # 按路径数量和路径最大分数进行粗排
             memory_scores_rough = []
             for mem_id, (memory, paths) in memory_paths.items():
@@ -349,7 +429,7 @@ class PathScoreExpansion:
             
             # 保留top候选
             memory_scores_rough.sort(key=lambda x: x[1], reverse=True)
-            retained_mem_ids = set(mem_id for mem_id, _ in memory_scores_rough[:self.config.max_candidate_memories])
+            retained_mem_ids = set(mem_id for mem_id, _ in memory_scores_rough[:cfg.max_candidate_memories])
             
             # 过滤
             memory_paths = {
@@ -385,7 +465,43 @@ class PathScoreExpansion:
 
         return result
 
-    async def _get_sorted_neighbor_edges(self, node_id: str) -> list[Any]:
+    def _expand_one(self, path: Path) -> list[tuple[Path, Any, str, float]]:
+        """
+        收集单条路径在本跳的扩展候选
+
+        Args:
+            path: 待扩展的路径
+
+        Returns:
+            候选列表 [(path, edge, next_node, edge_weight), ...]
+        """
+        current_node = path.get_leaf_node()
+        if not current_node:
+            return []
+
+        # 获取排序后的邻居边
+        neighbor_edges = self._get_sorted_neighbor_edges(current_node)
+
+        # 动态计算最大分叉数
+        max_branches = self._calculate_max_branches(path.score)
+        candidates = []
+
+        for edge in neighbor_edges[:max_branches]:
+            next_node = edge.target_id if edge.source_id == current_node else edge.source_id
+
+            # 避免环路
+            if path.contains_node(next_node):
+                continue
+
+            edge_weight = self._get_edge_weight(edge)
+            candidates.append((path, edge, next_node, edge_weight))
+
+            if len(candidates) >= max_branches:
+                break
+
+        return candidates
+
+    def _get_sorted_neighbor_edges(self, node_id: str) -> list[Any]:
         """
         获取节点的排序邻居边（按边权重排序）- 带缓存优化
 
@@ -399,27 +515,16 @@ class PathScoreExpansion:
         if node_id in self._neighbor_cache:
             return self._neighbor_cache[node_id]
         
-        edges = []
-
-        # 从图存储中获取与该节点相关的所有边
-        # 需要遍历所有记忆找到包含该节点的边
-        for memory_id in self.graph_store.node_to_memories.get(node_id, []):
-            memory = self.graph_store.get_memory_by_id(memory_id)
-            if memory:
-                for edge in memory.edges:
-                    if edge.source_id == node_id or edge.target_id == node_id:
-                        edges.append(edge)
-
-        # 去重（同一条边可能出现多次）
-        unique_edges = list({(e.source_id, e.target_id, e.edge_type): e for e in edges}.values())
+        # 🚀 直接读取图存储的邻接索引，O(度数)，插入时已去重
+        edges = self.graph_store.get_incident_edges(node_id)
 
         # 按边权重排序
-        unique_edges.sort(key=lambda e: self._get_edge_weight(e), reverse=True)
+        edges.sort(key=self._get_edge_weight, reverse=True)
 
         # 🚀 存入缓存
-        self._neighbor_cache[node_id] = unique_edges
+        self._neighbor_cache[node_id] = edges
 
-        return unique_edges
+        return edges
 
     def _get_edge_weight(self, edge: Any) -> float:
         """
@@ -431,6 +536,12 @@ class PathScoreExpansion:
         Returns:
             边权重
         """
+        # 排序和评分阶段会对同一条边重复调用，按 (源, 目标, 类型) 缓存
+        key = (edge.source_id, edge.target_id, edge.edge_type)
+        cached = self._edge_weight_cache.get(key)
+        if cached is not None:
+            return cached
+
         # 基础权重：边自身的重要性
         base_weight = getattr(edge, "importance", 0.5)
 
@@ -439,12 +550,76 @@ class PathScoreExpansion:
         type_weight = self.config.edge_type_weights.get(edge_type_str, self.config.edge_type_weights["DEFAULT"])
 
         # 综合权重
-        return base_weight * type_weight
+        weight = base_weight * type_weight
+        self._edge_weight_cache[key] = weight
+        return weight
+
+    async def _get_node_data(self, node_id: str) -> dict[str, Any] | None:
+        """
+        获取节点数据（单次查询内缓存，避免重复读取向量存储）
+
+        Args:
+            node_id: 节点ID
+
+        Returns:
+            节点数据或 None
+        """
+        if node_id in self._node_data_cache:
+            return self._node_data_cache[node_id]
+
+        try:
+            node_data = await self.vector_store.get_node_by_id(node_id)
+        except Exception as e:
+            logger.debug(f"获取节点数据失败 {node_id}: {e}")
+            node_data = None
+
+        self._node_data_cache[node_id] = node_data
+        return node_data
+
+    async def _prefetch_node_data(self, node_ids: list[str]) -> None:
+        """
+        批量预取一整个跳前沿的节点数据，写入节点数据缓存
+
+        Args:
+            node_ids: 节点ID列表
+        """
+        pending_ids = [nid for nid in node_ids if nid not in self._node_data_cache]
+        if not pending_ids:
+            return
+
+        try:
+            node_data_map = await self.vector_store.get_nodes_batch(pending_ids)
+        except Exception as e:
+            logger.debug(f"批量预取节点数据失败: {e}")
+            return
+
+        for nid in pending_ids:
+            self._node_data_cache[nid] = node_data_map.get(nid)
+
+    def _is_preferred_node(self, node_id: str) -> bool:
+        """
+        节点类型是否属于偏好类型（只依赖节点元数据，单独缓存）
+
+        Args:
+            node_id: 节点ID
+
+        Returns:
+            是否匹配偏好类型
+        """
+        matched = self._prefer_match_cache.get(node_id)
+        if matched is None:
+            node_attrs = self.graph_store.graph.nodes.get(node_id)
+            node_type = node_attrs.get("node_type") if node_attrs else None
+            matched = bool(node_type) and node_type in self.prefer_node_types
+            self._prefer_match_cache[node_id] = matched
+        return matched
 
     async def _get_node_score(self, node_id: str, query_embedding: "np.ndarray | None") -> float:
         """
         获取节点分数（基于与查询的相似度 + 偏好类型加成）
 
+        优先返回批量计算阶段写入的缓存，仅在缓存未命中时单独计算。
+
         Args:
             node_id: 节点ID
             query_embedding: 查询向量
@@ -452,30 +627,33 @@ class PathScoreExpansion:
         Returns:
             节点分数（0.0-1.0，偏好类型节点可能超过1.0）
         """
+        cached = self._node_score_cache.get(node_id)
+        if cached is not None:
+            return cached
+
         # 从向量存储获取节点数据
-        node_data = await self.vector_store.get_node_by_id(node_id)
-        
+        node_data = await self._get_node_data(node_id)
+
         if query_embedding is None:
             base_score = 0.5  # 默认中等分数
         else:
-            if not node_data or "embedding" not in node_data:
+            if not node_data or node_data.get("embedding") is None:
                 base_score = 0.3  # 无向量的节点给低分
             else:
                 node_embedding = node_data["embedding"]
                 similarity = cosine_similarity(query_embedding, node_embedding)
                 base_score = max(0.0, min(1.0, similarity))  # 限制在[0, 1]
 
+        score = base_score
         # 🆕 偏好类型加成
-        if self.prefer_node_types and node_data:
-            metadata = node_data.get("metadata", {})
-            node_type = metadata.get("node_type")
-            if node_type and node_type in self.prefer_node_types:
-                # 给予20%的分数加成
-                bonus = base_score * 0.2
-                logger.debug(f"节点 {node_id[:8]} 类型 {node_type} 匹配偏好，加成 {bonus:.3f}")
-                return base_score + bonus
+        if self.prefer_node_types and node_data and self._is_preferred_node(node_id):
+            # 给予20%的分数加成
+            bonus = base_score * 0.2
+            logger.debug(f"节点 {node_id[:8]} 匹配偏好类型，加成 {bonus:.3f}")
+            score = base_score + bonus
 
-        return base_score
+        self._node_score_cache[node_id] = score
+        return score
 
     async def _batch_get_node_scores(
         self, node_ids: list[str], query_embedding: "np.ndarray | None"
@@ -483,6 +661,9 @@ class PathScoreExpansion:
         """
         批量获取节点分数（性能优化版本）
 
+        已在向量存储内存矩阵中的节点通过一次矩阵-向量乘法得到相似度，
+        只有未索引的节点才需要回退到逐个读取向量存储。
+
         Args:
             node_ids: 节点ID列表
             query_embedding: 查询向量
@@ -490,70 +671,50 @@ class PathScoreExpansion:
         Returns:
             {node_id: score} 字典
         """
-        import numpy as np
+        score_cache = self._node_score_cache
 
-        scores = {}
-        
-        if query_embedding is None:
-            # 无查询向量时，返回默认分数
-            return {nid: 0.5 for nid in node_ids}
-        
-        # 批量获取节点数据
-        node_data_list = await asyncio.gather(
-            *[self.vector_store.get_node_by_id(nid) for nid in node_ids],
-            return_exceptions=True
-        )
-        
-        # 收集有效的嵌入向量
-        valid_embeddings = []
-        valid_node_ids = []
-        node_metadata_map = {}
-        
-        for nid, node_data in zip(node_ids, node_data_list):
-            if isinstance(node_data, Exception):
-                scores[nid] = 0.3
-                continue
-            
-            # 类型守卫：确保 node_data 是字典
-            if not node_data or not isinstance(node_data, dict) or "embedding" not in node_data:
-                scores[nid] = 0.3
+        # 之前的跳或分支已经评分过的节点直接复用
+        pending_ids = [nid for nid in node_ids if nid not in score_cache]
+
+        if pending_ids:
+            if query_embedding is None:
+                # 无查询向量时，使用默认分数
+                score_cache.update(dict.fromkeys(pending_ids, 0.5))
             else:
-                valid_embeddings.append(node_data["embedding"])
-                valid_node_ids.append(nid)
-                node_metadata_map[nid] = node_data.get("metadata", {})
-        
-        if valid_embeddings:
-            # 批量计算相似度（使用矩阵运算）
-            embeddings_matrix = np.array(valid_embeddings)
-            query_norm = np.linalg.norm(query_embedding)
-            embeddings_norms = np.linalg.norm(embeddings_matrix, axis=1)
-            
-            # 向量化计算余弦相似度
-            similarities = np.dot(embeddings_matrix, query_embedding) / (embeddings_norms * query_norm + 1e-8)
-            similarities = np.clip(similarities, 0.0, 1.0)
-            
-            # 应用偏好类型加成
-            for nid, sim in zip(valid_node_ids, similarities):
-                base_score = float(sim)
-                
-                # 偏好类型加成
-                if self.prefer_node_types and nid in node_metadata_map:
-                    node_type = node_metadata_map[nid].get("node_type")
-                    if node_type and node_type in self.prefer_node_types:
-                        bonus = base_score * 0.2
-                        scores[nid] = base_score + bonus
+                # 1. 内存矩阵命中的节点：一次 BLAS 调用完成
+                similarities = self.vector_store.batch_similarity(query_embedding, pending_ids)
+
+                # 2. 未命中的节点：一次批量读取向量存储（读取时会写入内存矩阵），然后再批量计算一次
+                missing_ids = [nid for nid in pending_ids if nid not in similarities]
+                if missing_ids:
+                    await self._prefetch_node_data(missing_ids)
+                    fetched_ids = [
+                        nid
+                        for nid in missing_ids
+                        if (node_data := self._node_data_cache.get(nid)) and node_data.get("embedding") is not None
+                    ]
+                    if fetched_ids:
+                        similarities.update(self.vector_store.batch_similarity(query_embedding, fetched_ids))
+
+                # 3. 组装分数（无向量的节点给低分）并应用偏好类型加成
+                for nid in pending_ids:
+                    base_score = similarities.get(nid)
+                    if base_score is None:
+                        score_cache[nid] = 0.3
+                    elif self.prefer_node_types and self._is_preferred_node(nid):
+                        score_cache[nid] = base_score * 1.2
                     else:
-                        scores[nid] = base_score
-                else:
-                    scores[nid] = base_score
-        
-        return scores
+                        score_cache[nid] = base_score
+
+        return {nid: score_cache[nid] for nid in node_ids}
 
-    def _calculate_path_score(self, old_score: float, edge_weight: float, node_score: float, depth: int) -> float:
+    def _calculate_path_score(
+        self, old_score: "np.ndarray", edge_weight: "np.ndarray", node_score: "np.ndarray", depth: int
+    ) -> "np.ndarray":
         """
         计算路径分数（核心公式）
 
-        使用指数衰减 + 边权重传播 + 节点分数注入
+        使用指数衰减 + 边权重传播 + 节点分数注入，对整跳候选按数组逐元素计算（标量同样适用）
 
         Args:
             old_score: 旧路径分数
@@ -564,8 +725,8 @@ class PathScoreExpansion:
         Returns:
             新路径分数
         """
-        # 指数衰减因子
-        decay = self.config.damping_factor**depth
+        # 指数衰减因子（查表）
+        decay = self.config._decay_table[depth]
 
         # 传播分数：旧分数 × 边权重 × 衰减
         propagated_score = old_score * edge_weight * decay
@@ -585,20 +746,42 @@ class PathScoreExpansion:
         Returns:
             最大分叉数
         """
-        if path_score > self.config.high_score_threshold:
-            return int(self.config.max_branches_per_node * 1.5)  # 高分路径多探索
-        elif path_score > self.config.medium_score_threshold:
-            return self.config.max_branches_per_node
+        cfg = self.config
+        if path_score > cfg.high_score_threshold:
+            return cfg._branches_high
+        elif path_score > cfg.medium_score_threshold:
+            return cfg._branches_med
         else:
-            return int(self.config.max_branches_per_node * 0.5)  # 低分路径少探索
+            return cfg._branches_low
+
+    @staticmethod
+    def _remove_beam_entry(beam: list[tuple[float, int, Path]], seq: int) -> None:
+        """
+        从束（最小堆）中移除指定序号的条目并恢复堆序，O(b)
 
-    def _try_merge_paths(self, new_path: Path, existing_paths: list[Path]) -> Path | None:
+        Args:
+            beam: 束，(score, seq, path) 最小堆
+            seq: 要移除的条目序号
+        """
+        for i, entry in enumerate(beam):
+            if entry[1] == seq:
+                last = beam.pop()
+                if i < len(beam):
+                    beam[i] = last
+                    heapq.heapify(beam)
+                return
+
+    def _try_merge_paths(
+        self,
+        new_path: Path,
+        endpoint_index: dict[str, tuple[int, Path]],
+    ) -> Path | None:
         """
-        尝试路径合并（端点相遇）
+        尝试路径合并（端点相遇）- O(1) 端点索引查找
 
         Args:
             new_path: 新路径
-            existing_paths: 现有路径列表
+            endpoint_index: 叶子节点 -> 束内未合并路径 (seq, path)，命中后移除
 
         Returns:
             合并后的路径，如果不合并则返回 None
@@ -607,29 +790,21 @@ class PathScoreExpansion:
         if not endpoint:
             return None
 
-        for existing in existing_paths:
-            if existing.get_leaf_node() == endpoint and not existing.is_merged:
-                # 端点相遇，合并路径
-                merged_score = self._merge_score(new_path.score, existing.score)
-
-                merged_path = Path(
-                    nodes=new_path.nodes,  # 保留新路径的节点序列
-                    edges=new_path.edges,
-                    score=merged_score,
-                    depth=new_path.depth,
-                    parent=new_path.parent,
-                    is_merged=True,
-                    merged_from=[new_path, existing],
-                )
+        hit = endpoint_index.pop(endpoint, None)
+        if hit is None:
+            return None
 
-                # 从现有列表中移除被合并的路径
-                existing_paths.remove(existing)
+        # 端点相遇，合并路径
+        _, existing = hit
+        merged_score = self._merge_score(new_path.score, existing.score)
 
-                logger.debug(f"🔀 路径合并: {new_path.score:.3f} + {existing.score:.3f} → {merged_score:.3f}")
+        logger.debug(f"🔀 路径合并: {new_path.score:.3f} + {existing.score:.3f} → {merged_score:.3f}")
 
-                return merged_path
+        # 保留新路径的节点序列，直接改写其分数作为合并结果（合并后的路径不会再进入端点索引）
+        # 被合并的路径由调用方移出束
+        new_path.score = merged_score
 
-        return None
+        return new_path
 
     def _merge_score(self, score1: float, score2: float) -> float:
         """
@@ -694,14 +869,19 @@ class PathScoreExpansion:
         all_memory_ids = set()
         path_to_memory_ids: dict[int, set[str]] = {}  # path对象id -> 记忆ID集合
 
-        for path in paths:
-            memory_ids_in_path = set()
-            
-            # 收集路径中所有节点涉及的记忆
-            for node_id in path.nodes:
-                memory_ids = self.graph_store.node_to_memories.get(node_id, [])
-                memory_ids_in_path.update(memory_ids)
-            
+        # 🚀 每个节点只查一次 node_to_memories（多条路径共享大量前缀节点）
+        path_nodes = [path.nodes for path in paths]
+        node_to_memories = self.graph_store.node_to_memories
+        node_mem_ids: dict[str, set[str] | tuple] = {
+            node_id: node_to_memories.get(node_id, ())
+            for nodes in path_nodes
+            for node_id in nodes
+        }
+
+        for path, nodes in zip(paths, path_nodes):
+            # 收集路径中所有节点涉及的记忆（set.union 一次完成）
+            memory_ids_in_path = set().union(*(node_mem_ids[node_id] for node_id in nodes))
+
             all_memory_ids.update(memory_ids_in_path)
             path_to_memory_ids[id(path)] = memory_ids_in_path
 
@@ -744,79 +924,57 @@ class PathScoreExpansion:
         Returns:
             [(Memory, final_score, paths), ...]
         """
-        scored_memories = []
-        
-        # 🚀 性能优化：如果需要偏好类型加成，批量预加载所有节点的类型信息
-        node_type_cache: dict[str, str | None] = {}
-        
+        if not memory_paths:
+            return []
+
+        entries = list(memory_paths.values())
+        count = len(entries)
+
+        # 🚀 偏好类型匹配比例：一次批量预取全部节点数据，再逐记忆统计匹配数
+        type_bonus_ratio = np.zeros(count)
         if self.prefer_node_types:
-            # 收集所有需要查询的节点ID
-            all_node_ids = set()
-            for memory, _ in memory_paths.values():
-                memory_nodes = getattr(memory, "nodes", [])
-                for node in memory_nodes:
-                    node_id = node.id if hasattr(node, "id") else str(node)
-                    all_node_ids.add(node_id)
-            
-            # 批量获取节点数据
+            all_node_ids = {node.id for memory, _ in entries for node in memory.nodes}
             if all_node_ids:
                 logger.debug(f"🔍 批量预加载 {len(all_node_ids)} 个节点的类型信息")
-                node_data_list = await asyncio.gather(
-                    *[self.vector_store.get_node_by_id(nid) for nid in all_node_ids],
-                    return_exceptions=True
-                )
-                
-                # 构建类型缓存
-                for nid, node_data in zip(all_node_ids, node_data_list):
-                    if isinstance(node_data, Exception) or not node_data or not isinstance(node_data, dict):
-                        node_type_cache[nid] = None
-                    else:
-                        metadata = node_data.get("metadata", {})
-                        node_type_cache[nid] = metadata.get("node_type")
-
-        # 遍历所有记忆进行评分
-        for mem_id, (memory, paths) in memory_paths.items():
-            # 1. 聚合路径分数
-            path_score = self._aggregate_path_scores(paths)
-
-            # 2. 计算重要性分数
-            importance_score = memory.importance
-
-            # 3. 计算时效性分数
-            recency_score = self._calculate_recency(memory)
-
-            # 4. 综合评分
-            weights = self.config.final_scoring_weights
-            base_final_score = (
-                path_score * weights["path_score"]
-                + importance_score * weights["importance"]
-                + recency_score * weights["recency"]
-            )
+                await self._prefetch_node_data(list(all_node_ids))
+
+                prefer_types = set(self.prefer_node_types)
+                preferred_ids = set()
+                for nid in all_node_ids:
+                    node_data = self._node_data_cache.get(nid)
+                    node_type = node_data.get("metadata", {}).get("node_type") if node_data else None
+                    if node_type in prefer_types:
+                        preferred_ids.add(nid)
+
+                for i, (memory, _) in enumerate(entries):
+                    if memory.nodes:
+                        matched_count = sum(1 for node in memory.nodes if node.id in preferred_ids)
+                        type_bonus_ratio[i] = matched_count / len(memory.nodes)
+
+        # 🚀 向量化综合评分：路径分数、重要性、时效性一次性按权重求和
+        path_scores = np.fromiter((self._aggregate_path_scores(paths) for _, paths in entries), dtype=float, count=count)
+        importance = np.fromiter((memory.importance for memory, _ in entries), dtype=float, count=count)
+        created_ts = np.fromiter((memory.created_at_ts for memory, _ in entries), dtype=float, count=count)
+
+        # 当前时间在整个评分过程中不变，只取一次
+        recency = self._calculate_recency(created_ts, time.time())
+
+        weights = self.config.final_scoring_weights
+        final_scores = (
+            path_scores * weights["path_score"]
+            + importance * weights["importance"]
+            + recency * weights["recency"]
+        )
+        # 🆕 偏好类型加成：按匹配比例最高加成 10%
+        final_scores *= 1.0 + 0.1 * type_bonus_ratio
+
+        if self.prefer_node_types:
+            logger.debug(f"偏好类型加成: {int(np.count_nonzero(type_bonus_ratio))}/{count} 条记忆包含偏好类型节点")
 
-            # 🆕 5. 偏好类型加成（使用缓存的类型信息）
-            type_bonus = 0.0
-            if self.prefer_node_types and node_type_cache:
-                memory_nodes = getattr(memory, "nodes", [])
-                if memory_nodes:
-                    # 使用缓存快速计算匹配数
-                    matched_count = 0
-                    for node in memory_nodes:
-                        node_id = node.id if hasattr(node, "id") else str(node)
-                        node_type = node_type_cache.get(node_id)
-                        if node_type and node_type in self.prefer_node_types:
-                            matched_count += 1
-                    
-                    if matched_count > 0:
-                        match_ratio = matched_count / len(memory_nodes)
-                        # 根据匹配比例给予加成（最高10%）
-                        type_bonus = base_final_score * match_ratio * 0.1
-                        logger.debug(
-                            f"记忆 {mem_id[:8]} 包含 {matched_count}/{len(memory_nodes)} 个偏好类型节点，"
-                            f"加成 {type_bonus:.3f}"
-                        )
-
-            final_score = base_final_score + type_bonus
-            scored_memories.append((memory, final_score, paths))
+        scored_memories = [
+            (memory, final_score, paths)
+            for (memory, paths), final_score in zip(entries, final_scores.tolist())
+        ]
 
         return scored_memories
 
@@ -843,31 +1001,22 @@ class PathScoreExpansion:
         # 组合：40% 总分 + 60% Top均分
         return total_score * 0.4 + avg_top * 0.6
 
-    def _calculate_recency(self, memory: Any) -> float:
+    def _calculate_recency(self, created_ts: "np.ndarray", now_ts: float) -> "np.ndarray":
         """
-        计算时效性分数
+        批量计算时效性分数
 
         Args:
-            memory: 记忆对象
+            created_ts: 记忆创建时间的 UTC 时间戳数组（秒）
+            now_ts: 当前 UTC 时间戳（秒），由调用方统一获取
 
         Returns:
-            时效性分数 [0, 1]
+            时效性分数数组 [0, 1]
         """
-        now = datetime.now(timezone.utc)
-
-        # 确保时间有时区信息
-        if memory.created_at.tzinfo is None:
-            memory_time = memory.created_at.replace(tzinfo=timezone.utc)
-        else:
-            memory_time = memory.created_at
-
-        # 计算天数差
-        age_days = (now - memory_time).total_seconds() / 86400
+        # 计算天数差（纯浮点运算，时区已在记忆构建时处理）
+        age_days = (now_ts - created_ts) / 86400
 
         # 30天半衰期
-        recency_score = 1.0 / (1.0 + age_days / 30)
-
-        return recency_score
+        return 1.0 / (1.0 + age_days / 30)
 
 
 __all__ = ["PathScoreExpansion", "PathExpansionConfig", "Path"]
@@ -4,16 +4,16 @@
 提供统一的向量相似度计算函数
 """
 
-from typing import TYPE_CHECKING
+import numpy as np
 
-if TYPE_CHECKING:
-    import numpy as np
 
-
-def cosine_similarity(vec1: "np.ndarray", vec2: "np.ndarray") -> float:
+def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     计算两个向量的余弦相似度
 
+    标量版本，仅作为回退路径；批量场景请使用 VectorStore.batch_similarity。
+    调用方在循环中逐对计算，向量缺失或维度不一致时返回 0.0，不中断整轮计算。
+
     Args:
         vec1: 第一个向量
         vec2: 第二个向量
@@ -21,30 +21,24 @@ def cosine_similarity(vec1: "np.ndarray", vec2: "np.ndarray") -> float:
     Returns:
         余弦相似度 (0.0-1.0)
     """
-    try:
-        import numpy as np
-
-        # 确保是numpy数组
-        if not isinstance(vec1, np.ndarray):
-            vec1 = np.array(vec1)
-        if not isinstance(vec2, np.ndarray):
-            vec2 = np.array(vec2)
+    if vec1 is None or vec2 is None:
+        return 0.0
 
-        # 归一化
-        vec1_norm = np.linalg.norm(vec1)
-        vec2_norm = np.linalg.norm(vec2)
+    try:
+        vec1 = np.asarray(vec1, dtype=np.float32)
+        vec2 = np.asarray(vec2, dtype=np.float32)
 
-        if vec1_norm == 0 or vec2_norm == 0:
+        # 三次点积代替 norm/norm/dot，省去 linalg.norm 的额外开销
+        norm_product = float(np.dot(vec1, vec1)) * float(np.dot(vec2, vec2))
+        if norm_product == 0.0:
             return 0.0
 
-        # 余弦相似度
-        similarity = np.dot(vec1, vec2) / (vec1_norm * vec2_norm)
-
-        # 确保在 [0, 1] 范围内（处理浮点误差）
-        return float(np.clip(similarity, 0.0, 1.0))
-
-    except Exception:
+        similarity = float(np.dot(vec1, vec2)) / norm_product**0.5
+    except (TypeError, ValueError):
         return 0.0
 
+    # 确保在 [0, 1] 范围内（处理浮点误差）
+    return min(max(similarity, 0.0), 1.0)
+
 
 __all__ = ["cosine_similarity"]
@@ -38,6 +38,7 @@ from .base import (
     ComponentInfo,
     ComponentType,
     ConfigField,
+    ConfigView,
     EventHandlerInfo,
     EventType,
     MaiMessages,
@@ -74,6 +75,7 @@ __all__ = [
     # 类型定义
     "ComponentType",
     "ConfigField",
+    "ConfigView",
     "EventHandlerInfo",
     "EventType",
     # 消息
@@ -9,6 +9,8 @@
 import atexit
 import os
 import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, ClassVar
 
 import orjson
@@ -55,8 +57,8 @@ class PluginStorageManager:
         with cls._lock:
             for name, instance in cls._instances.items():
                 logger.debug(f"正在检查插件 '{name}' 的数据...")
-                # 直接调用实例的_save_data，它会检查_dirty标志
-                instance._save_data()
+                # flush 会取消挂起的计时器，并在 _dirty 时立即写盘
+                instance.flush()
         logger.info("所有插件数据均已妥善保存。")
 
 
@@ -116,6 +118,8 @@ class PluginStorage:
             if self._write_timer:
                 self._write_timer.cancel()
             self._write_timer = threading.Timer(self.save_delay, self._save_data)
+            # 守护线程：退出时不必等计时器到点，剩余数据由 atexit 的 shutdown 负责 flush
+            self._write_timer.daemon = True
             self._write_timer.start()
             logger.debug(f"插件 '{self.name}' 的数据修改已暂存，计划在 {self.save_delay} 秒后写入磁盘。")
 
@@ -125,14 +129,28 @@ class PluginStorage:
                 return  # 数据没有被修改，不需要保存
 
             try:
-                with open(self.file_path, "w", encoding="utf-8") as f:
-                    f.write(orjson.dumps(self._data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+                # 先写临时文件再原子替换，避免写到一半崩溃留下损坏的 JSON
+                tmp_path = f"{self.file_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(self._data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                os.replace(tmp_path, self.file_path)
                 self._dirty = False  # 保存后重置标志
                 logger.debug(f"插件 '{self.name}' 的数据已成功保存到磁盘。")
             except Exception as e:
                 logger.error(f"向 '{self.file_path}' 保存数据时发生错误: {e}", exc_info=True)
                 raise
 
+    def flush(self) -> None:
+        """
+        立即把未写入的修改保存到磁盘。
+        会取消还没到点的延迟写入计时器，适合在插件卸载或程序关闭时调用。
+        """
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+        self._save_data()
+
     def get(self, key: str, default: Any | None = None) -> Any:
         return self._data.get(key, default)
 
@@ -177,9 +195,17 @@ class PluginStorage:
     def get_all(self) -> dict[str, Any]:
         return self._data.copy()
 
+    def get_all_view(self) -> Mapping[str, Any]:
+        """
+        获取全部数据的只读视图。
+        零拷贝，视图会随存储的修改实时变化，迭代期间不要修改存储；需要快照时请使用 get_all()。
+        """
+        return MappingProxyType(self._data)
+
     def clear(self) -> None:
         logger.warning(f"插件 '{self.name}' 的本地存储将被清空！")
-        self._data = {}
+        # 原地清空，保证已发出的只读视图仍指向当前数据
+        self._data.clear()
         self._schedule_save()
 
 
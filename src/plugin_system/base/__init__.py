@@ -28,7 +28,7 @@ from .component_types import (
     ToolInfo,
     ToolParamType,
 )
-from .config_types import ConfigField
+from .config_types import ConfigField, ConfigView
 from .plugin_metadata import PluginMetadata
 from .plus_command import PlusCommand, create_plus_command_adapter
 
@@ -48,6 +48,7 @@ __all__ = [
     "ComponentInfo",
     "ComponentType",
     "ConfigField",
+    "ConfigView",
     "EventHandlerInfo",
     "EventType",
     "MaiMessages",
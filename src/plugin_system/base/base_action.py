@@ -270,7 +270,8 @@ class BaseAction(ABC):
                 logger.error(f"{self.log_prefix} 等待新消息失败: 没有有效的chat_id")
                 return False, "没有有效的chat_id"
 
-            wait_start_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_running_loop()
+            wait_start_time = loop.time()
             while True:
                 # 检查关闭标志
                 # shutting_down = self.get_action_context("shutting_down", False)
@@ -289,7 +290,7 @@ class BaseAction(ABC):
                     return True, ""
 
                 # 检查超时
-                elapsed_time = asyncio.get_event_loop().time() - wait_start_time
+                elapsed_time = loop.time() - wait_start_time
                 if elapsed_time > timeout:
                     logger.warning(f"{self.log_prefix} 等待新消息超时({timeout}秒)，聊天ID: {self.chat_id}")
                     return False, ""
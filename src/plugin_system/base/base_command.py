@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, ClassVar
 from src.common.data_models.database_data_model import DatabaseMessages
 from src.common.logger import get_logger
 from src.plugin_system.base.component_types import ChatType, CommandInfo, ComponentType
+from src.plugin_system.base.config_types import ConfigView
 from src.plugin_system.base.plus_command import PlusCommand
 
 if TYPE_CHECKING:
@@ -32,10 +33,18 @@ class BaseCommand(PlusCommand):
     command_pattern: str = r""
     """命令匹配的正则表达式"""
 
-    # 用于存储正则匹配组
-    matched_groups: ClassVar[dict[str, str]] = {}
+    # 用于存储正则匹配组（实例属性，在 __init__ 中初始化；不在类上放可变默认值，避免各子类共享同一个字典）
+    matched_groups: dict[str, str]
 
-    def __init__(self, message: DatabaseMessages, plugin_config: dict | None = None):
+    # 类定义时预先构建的组件信息（见 __init_subclass__）
+    _command_info: ClassVar["CommandInfo | None"] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 组件信息只依赖类属性，类定义后不再变化：在定义时校验并构建一次，之后直接返回
+        cls._command_info = cls._build_command_info()
+
+    def __init__(self, message: DatabaseMessages, plugin_config: dict | ConfigView | None = None):
         """初始化Command组件"""
         # 调用PlusCommand的初始化
         super().__init__(message, plugin_config)
@@ -59,7 +68,12 @@ class BaseCommand(PlusCommand):
 
     @classmethod
     def get_command_info(cls) -> "CommandInfo":
-        """从类属性生成CommandInfo"""
+        """获取从类属性生成的CommandInfo（子类在定义时已构建）"""
+        return cls._command_info or cls._build_command_info()
+
+    @classmethod
+    def _build_command_info(cls) -> "CommandInfo":
+        """校验类属性并生成CommandInfo"""
         if "." in cls.command_name:
             logger.error(f"Command名称 '{cls.command_name}' 包含非法字符 '.'，请使用下划线替代")
             raise ValueError(f"Command名称 '{cls.command_name}' 包含非法字符 '.'，请使用下划线替代")
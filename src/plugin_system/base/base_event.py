@@ -13,6 +13,9 @@ class HandlerResult:
     所有事件处理器必须返回此类的实例
     """
 
+    # 每个事件的每个处理器都会创建一个结果对象，使用 __slots__ 省去 __dict__
+    __slots__ = ("continue_process", "handler_name", "message", "success")
+
     def __init__(self, success: bool, continue_process: bool, message: Any = None, handler_name: str = ""):
         self.success = success
         self.continue_process = continue_process
@@ -95,6 +98,9 @@ class BaseEvent:
         self.allowed_triggers = allowed_triggers  # 记录插件名
 
         self.subscribers: list["BaseEventHandler"] = []  # 订阅该事件的事件处理器列表
+        # 按权重排序后的订阅者缓存，订阅者列表变化时才重新排序
+        self._sorted_subscribers: tuple["BaseEventHandler", ...] = ()
+        self._sorted_source: tuple["BaseEventHandler", ...] = ()
 
         self.event_handle_lock = asyncio.Lock()
 
@@ -110,26 +116,25 @@ class BaseEvent:
         Returns:
             HandlerResultsCollection: 所有处理器的执行结果集合
         """
-        if not self.enabled:
+        if not self.enabled or not self.subscribers:
             return HandlerResultsCollection([])
 
         # 使用锁确保同一个事件不能同时激活多次
         async with self.event_handle_lock:
-            # 按权重从高到低排序订阅者
-            # 使用直接属性访问，-1代表自动权重
-            sorted_subscribers = sorted(
-                self.subscribers, key=lambda h: h.weight if hasattr(h, "weight") and h.weight != -1 else 0, reverse=True
-            )
-
-            # 并行执行所有订阅者
-            tasks = []
-            for subscriber in sorted_subscribers:
-                # 为每个订阅者创建执行任务
-                task = self._execute_subscriber(subscriber, params)
-                tasks.append(task)
-
-            # 等待所有任务完成
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            sorted_subscribers = self._get_sorted_subscribers()
+
+            if len(sorted_subscribers) == 1:
+                # 只有一个订阅者时直接等待，省去 gather 的调度开销
+                try:
+                    results = [await self._execute_subscriber(sorted_subscribers[0], params)]
+                except Exception as e:
+                    results = [e]
+            else:
+                # 并行执行所有订阅者，等待所有任务完成
+                results = await asyncio.gather(
+                    *(self._execute_subscriber(subscriber, params) for subscriber in sorted_subscribers),
+                    return_exceptions=True,
+                )
 
             # 处理执行结果
             processed_results = []
@@ -152,6 +157,20 @@ class BaseEvent:
 
             return HandlerResultsCollection(processed_results)
 
+    def _get_sorted_subscribers(self) -> tuple["BaseEventHandler", ...]:
+        """获取按权重从高到低排序的订阅者（-1代表自动权重），订阅者未变化时直接复用上次结果"""
+        current = tuple(self.subscribers)
+        if current != self._sorted_source:
+            self._sorted_subscribers = tuple(
+                sorted(
+                    current,
+                    key=lambda h: h.weight if hasattr(h, "weight") and h.weight != -1 else 0,
+                    reverse=True,
+                )
+            )
+            self._sorted_source = current
+        return self._sorted_subscribers
+
     @staticmethod
     async def _execute_subscriber(subscriber, params: dict) -> HandlerResult:
         """执行单个订阅者处理器"""
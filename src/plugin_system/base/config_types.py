@@ -2,7 +2,9 @@
 插件系统配置类型定义
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
@@ -16,3 +18,46 @@ class ConfigField:
     example: str | None = None  # 示例值
     required: bool = False  # 是否必需
     choices: list[Any] | None = field(default_factory=list)  # 可选值列表
+
+
+def flatten_config(config: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """将嵌套配置展开为以点号路径为键的扁平字典
+
+    中间层级（子表）本身也会保留为键，因此任意合法的点号路径都能一次字典查找命中，
+    结果与逐层 split(".") 查找一致。
+
+    Args:
+        config: 嵌套配置字典
+        prefix: 键路径前缀（递归内部使用）
+
+    Returns:
+        dict[str, Any]: 点号路径 -> 配置值
+    """
+    flat: dict[str, Any] = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten_config(value, f"{path}."))
+    return flat
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigView:
+    """插件配置的只读视图
+
+    构建时一次性展开点号路径索引，get 只需一次字典查找，
+    无需每次 split(".") 后逐层查找。同一份配置应复用同一个视图。
+    """
+
+    source: dict[str, Any]  # 原始嵌套配置
+    _flat: Mapping[str, Any] = field(repr=False)  # 点号路径 -> 配置值
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "ConfigView":
+        """从嵌套配置字典构建视图"""
+        return cls(config, MappingProxyType(flatten_config(config)))
+
+    def get(self, dotted_key: str, default: Any = None) -> Any:
+        """按点号路径获取配置值，如 section.subsection.key"""
+        return self._flat.get(dotted_key, default)
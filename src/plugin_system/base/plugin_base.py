@@ -13,7 +13,7 @@ from src.plugin_system.base.component_types import (
     PermissionNodeField,
     PluginInfo,
 )
-from src.plugin_system.base.config_types import ConfigField
+from src.plugin_system.base.config_types import ConfigField, ConfigView
 from src.plugin_system.base.plugin_metadata import PluginMetadata
 
 logger = get_logger("plugin_base")
@@ -44,6 +44,7 @@ class PluginBase(ABC):
             metadata: 插件元数据对象
         """
         self.config: dict[str, Any] = {}  # 插件配置
+        self._config_view: ConfigView | None = None  # 配置的点号路径索引视图，见 config_view
         self.plugin_dir = plugin_dir  # 插件目录路径
         self.plugin_meta = metadata  # 插件元数据
         self.log_prefix = f"[Plugin:{self.plugin_name}]"
@@ -368,17 +369,19 @@ class PluginBase(ABC):
         Returns:
             Any: 配置值或默认值
         """
-        # 支持嵌套键访问
-        keys = key.split(".")
-        current = self.config
+        return self.config_view.get(key, default)
 
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return default
+    @property
+    def config_view(self) -> ConfigView:
+        """当前配置的只读视图
 
-        return current
+        配置对象被替换（加载/重新加载）时重建索引，之后每次查找只需一次字典访问；
+        组件实例可共享此视图，避免各自重复解析点号路径。
+        """
+        view = self._config_view
+        if view is None or view.source is not self.config:
+            view = self._config_view = ConfigView.from_dict(self.config)
+        return view
 
     @abstractmethod
     def register_plugin(self) -> bool:
@@ -13,6 +13,7 @@ from src.config.config import global_config
 from src.plugin_system.apis import send_api
 from src.plugin_system.base.command_args import CommandArgs
 from src.plugin_system.base.component_types import ChatType, ComponentType, PlusCommandInfo
+from src.plugin_system.base.config_types import ConfigView
 
 if TYPE_CHECKING:
     from src.chat.message_receive.chat_stream import ChatStream
@@ -53,15 +54,21 @@ class PlusCommand(ABC):
     intercept_message: bool = False
     """是否拦截消息，不进行后续处理"""
 
-    def __init__(self, message: DatabaseMessages, plugin_config: dict | None = None):
+    def __init__(self, message: DatabaseMessages, plugin_config: dict | ConfigView | None = None):
         """初始化命令组件
 
         Args:
             message: 接收到的消息对象（DatabaseMessages）
-            plugin_config: 插件配置字典
+            plugin_config: 插件配置字典，或插件共享的配置视图（ConfigView）
         """
         self.message = message
-        self.plugin_config = plugin_config or {}
+        # 传入配置视图时直接复用其点号路径索引，plugin_config 仍保留原始字典以兼容直接访问
+        self._config_view: ConfigView | None = None
+        if isinstance(plugin_config, ConfigView):
+            self._config_view = plugin_config
+            self.plugin_config = plugin_config.source
+        else:
+            self.plugin_config = plugin_config or {}
         self.log_prefix = "[PlusCommand]"
 
         # chat_stream 会在运行时被 bot.py 设置
@@ -198,6 +205,9 @@ class PlusCommand(ABC):
         Returns:
             Any: 配置值或默认值
         """
+        if self._config_view is not None:
+            return self._config_view.get(key, default)
+
         if not self.plugin_config:
             return default
 
@@ -354,7 +364,7 @@ def create_plus_command_adapter(plus_command_class):
         command_pattern = plus_command_class._generate_command_pattern()
         chat_type_allow = getattr(plus_command_class, "chat_type_allow", ChatType.ALL)
 
-        def __init__(self, message: DatabaseMessages, plugin_config: dict | None = None):
+        def __init__(self, message: DatabaseMessages, plugin_config: dict | ConfigView | None = None):
             super().__init__(message, plugin_config)
             self.plus_command = plus_command_class(message, plugin_config)
             self.priority = getattr(plus_command_class, "priority", 0)
@@ -405,7 +415,7 @@ def create_legacy_command_adapter(legacy_command_class):
         chat_type_allow = getattr(legacy_command_class, "chat_type_allow", ChatType.ALL)
         intercept_message = False  # 旧命令默认为False
 
-        def __init__(self, message: DatabaseMessages, plugin_config: dict | None = None):
+        def __init__(self, message: DatabaseMessages, plugin_config: dict | ConfigView | None = None):
             super().__init__(message, plugin_config)
             # 实例化旧命令
             self.legacy_command = legacy_command_class(message, plugin_config)
@@ -26,6 +26,7 @@ from src.plugin_system.base.component_types import (
     PromptInfo,
     ToolInfo,
 )
+from src.plugin_system.base.config_types import ConfigView
 from src.plugin_system.base.plus_command import PlusCommand, create_legacy_command_adapter
 
 logger = get_logger("component_registry")
@@ -858,6 +859,26 @@ class ComponentRegistry:
 
         return {}
 
+    def get_plugin_config_view(self, plugin_name: str) -> ConfigView:
+        """获取插件配置的只读视图
+
+        插件实例已加载时返回其缓存的视图（点号路径索引只构建一次），
+        供每条消息都会实例化的组件（如命令）直接复用。
+
+        Args:
+            plugin_name: 插件名称
+
+        Returns:
+            ConfigView: 插件配置视图
+        """
+        from src.plugin_system.core.plugin_manager import plugin_manager
+
+        plugin_instance = plugin_manager.get_plugin_instance(plugin_name)
+        if plugin_instance and plugin_instance.config:
+            return plugin_instance.config_view
+
+        return ConfigView.from_dict(self.get_plugin_config(plugin_name))
+
     def get_registry_stats(self) -> dict[str, Any]:
         """获取注册中心统计信息"""
         action_components: int = 0
@@ -300,23 +300,21 @@ class PermissionManager(IPermissionManager):
                 result = await session.execute(select(PermissionNodes))
                 all_nodes = result.scalars().all()
 
-                for node in all_nodes:
-                    # 检查用户是否有明确的权限设置
-                    result = await session.execute(
-                        select(UserPermissions).filter_by(
-                            platform=user.platform, user_id=user.user_id, permission_node=node.node_name
-                        )
+                # 一次取出该用户的全部明确权限设置，避免逐节点查询
+                result = await session.execute(
+                    select(UserPermissions.permission_node, UserPermissions.granted).filter_by(
+                        platform=user.platform, user_id=user.user_id
                     )
-                    user_perm = result.scalar_one_or_none()
-
-                    if user_perm:
-                        # 有明确设置，使用设置的值
-                        if user_perm.granted:
-                            permissions.append(node.node_name)
-                    else:
-                        # 没有明确设置，使用默认值
-                        if node.default_granted:
-                            permissions.append(node.node_name)
+                )
+                explicit_grants = dict(result.all())
+
+                for node in all_nodes:
+                    # 有明确设置则使用设置的值，否则使用默认值
+                    granted = explicit_grants.get(node.node_name)
+                    if granted is None:
+                        granted = node.default_granted
+                    if granted:
+                        permissions.append(node.node_name)
 
             return permissions
 
@@ -5,6 +5,7 @@
 
 import time
 from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any
 
 import orjson
@@ -15,13 +16,25 @@ from src.common.logger import get_logger
 logger = get_logger("stream_tool_history")
 
 
+class ToolCallStatus(StrEnum):
+    """工具调用状态
+
+    枚举成员为单例，状态判断退化为指针比较；同时继承 str，与裸字符串比较/序列化保持兼容
+    """
+
+    SUCCESS = "success"
+    ERROR = "error"
+    PENDING = "pending"
+    TIMEOUT = "timeout"
+
+
 @dataclass
 class ToolCallRecord:
     """工具调用记录"""
     tool_name: str
     args: dict[str, Any]
     result: dict[str, Any] | None = None
-    status: str = "success"  # success, error, pending
+    status: ToolCallStatus | str = ToolCallStatus.SUCCESS
     timestamp: float = field(default_factory=time.time)
     execution_time: float | None = None  # 执行耗时(秒)
     cache_hit: bool = False  # 是否命中缓存
@@ -29,7 +42,15 @@ class ToolCallRecord:
     error_message: str = ""  # 错误信息
 
     def __post_init__(self):
-        """后处理：生成结果预览"""
+        """后处理：规范化状态并生成结果预览"""
+        # 兼容以裸字符串传入的状态，已知状态统一转为枚举单例，后续判断可直接用 is 比较；
+        # 插件自定义的未知状态保留原值，不在构造时抛错
+        if not isinstance(self.status, ToolCallStatus):
+            try:
+                self.status = ToolCallStatus(self.status)
+            except ValueError:
+                logger.debug(f"未知的工具调用状态，保留原值: {self.status!r}")
+
         if self.result and not self.result_preview:
             content = self.result.get("content", "")
             if isinstance(content, str):
@@ -148,7 +169,7 @@ class StreamToolHistoryManager:
                         tool_name=tool_name,
                         args=args,
                         result=cached_result,
-                        status="success",
+                        status=ToolCallStatus.SUCCESS,
                         cache_hit=True,
                         timestamp=time.time(),
                     )
@@ -180,7 +201,7 @@ class StreamToolHistoryManager:
             tool_name=tool_name,
             args=args,
             result=result,
-            status="success",
+            status=ToolCallStatus.SUCCESS,
             execution_time=execution_time,
             cache_hit=False,
             timestamp=time.time(),
@@ -209,12 +230,12 @@ class StreamToolHistoryManager:
         except Exception as e:
             logger.warning(f"[{self.chat_id}] 缓存设置失败: {e}")
 
-    def get_recent_history(self, count: int = 5, status_filter: str | None = None) -> list[ToolCallRecord]:
+    def get_recent_history(self, count: int = 5, status_filter: ToolCallStatus | str | None = None) -> list[ToolCallRecord]:
         """获取最近的历史记录
 
         Args:
             count: 返回的记录数量
-            status_filter: 状态过滤器，可选值：success, error, pending
+            status_filter: 状态过滤器，可选值：success, error, pending, timeout
 
         Returns:
             历史记录列表
@@ -245,7 +266,7 @@ class StreamToolHistoryManager:
 
         lines = ["## 🔧 最近工具调用记录"]
         for i, record in enumerate(recent_records, 1):
-            status_icon = "✅" if record.status == "success" else "❌" if record.status == "error" else "⏳"
+            status_icon = "✅" if record.status is ToolCallStatus.SUCCESS else "❌" if record.status is ToolCallStatus.ERROR else "⏳"
 
             # 格式化参数
             args_preview = self._format_args_preview(record.args)
@@ -264,7 +285,7 @@ class StreamToolHistoryManager:
                 lines.append(f"   📝 结果: {record.result_preview}")
 
             # 添加错误信息
-            if record.status == "error" and record.error_message:
+            if record.status is ToolCallStatus.ERROR and record.error_message:
                 lines.append(f"   ❌ 错误: {record.error_message}")
 
         # 添加统计信息
@@ -309,7 +330,7 @@ class StreamToolHistoryManager:
         """
         for record in reversed(self._history):  # 从最新的开始搜索
             if (record.tool_name == tool_name and
-                record.status == "success" and
+                record.status is ToolCallStatus.SUCCESS and
                 record.args == args):
                 return record.result
         return None
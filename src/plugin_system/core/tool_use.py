@@ -12,7 +12,11 @@ from src.llm_models.utils_model import LLMRequest
 from src.plugin_system.apis.tool_api import get_llm_available_tool_definitions, get_tool_instance
 from src.plugin_system.base.base_tool import BaseTool
 from src.plugin_system.core.global_announcement_manager import global_announcement_manager
-from src.plugin_system.core.stream_tool_history import ToolCallRecord, get_stream_tool_history_manager
+from src.plugin_system.core.stream_tool_history import (
+    ToolCallRecord,
+    ToolCallStatus,
+    get_stream_tool_history_manager,
+)
 
 logger = get_logger("tool_use")
 
@@ -294,7 +298,7 @@ class ToolExecutor:
                     tool_name=tool_name,
                     args=tool_args,
                     result=None,
-                    status="error" if not exec_result.is_timeout else "timeout",
+                    status=ToolCallStatus.ERROR if not exec_result.is_timeout else ToolCallStatus.TIMEOUT,
                     error_message=str(exec_result.error),
                     execution_time=exec_result.execution_time
                 ))
@@ -322,7 +326,7 @@ class ToolExecutor:
                     tool_name=tool_name,
                     args=tool_args,
                     result=exec_result.result,
-                    status="success",
+                    status=ToolCallStatus.SUCCESS,
                     execution_time=exec_result.execution_time
                 ))
             else:
@@ -331,7 +335,7 @@ class ToolExecutor:
                     tool_name=tool_name,
                     args=tool_args,
                     result=None,
-                    status="success",
+                    status=ToolCallStatus.SUCCESS,
                     execution_time=exec_result.execution_time
                 ))
 
@@ -501,7 +505,7 @@ class ToolExecutor:
                         tool_name=tool_call.func_name,
                         args=function_args,
                         result=cached_result,
-                        status="success",
+                        status=ToolCallStatus.SUCCESS,
                         execution_time=execution_time,
                         cache_hit=True
                     ))
@@ -669,7 +673,7 @@ class ToolExecutor:
                     tool_name=tool_name,
                     args=tool_args,
                     result=result,
-                    status="success"
+                    status=ToolCallStatus.SUCCESS
                 ))
 
                 return tool_info
@@ -681,7 +685,7 @@ class ToolExecutor:
                 tool_name=tool_name,
                 args=tool_args,
                 result=None,
-                status="error",
+                status=ToolCallStatus.ERROR,
                 error_message=str(e)
             ))
 
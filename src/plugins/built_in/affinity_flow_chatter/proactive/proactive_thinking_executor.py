@@ -14,7 +14,7 @@ from src.common.database.core.models import ChatStreams
 from src.common.database.utils.decorators import cached
 from src.common.logger import get_logger
 from src.config.config import global_config, model_config
-from src.individuality.individuality import Individuality
+from src.individuality.individuality import get_individuality
 from src.llm_models.utils_model import LLMRequest
 from src.plugin_system.apis import message_api, send_api
 from src.utils.json_parser import extract_and_parse_json
@@ -161,6 +161,8 @@ class ProactiveThinkingPlanner:
     3. 根据决策生成回复内容
     """
 
+    __slots__ = ("decision_llm", "reply_llm")
+
     def __init__(self):
         """初始化规划器"""
         try:
@@ -185,44 +187,20 @@ class ProactiveThinkingPlanner:
             dict: 包含所有上下文信息的字典，失败返回None
         """
         try:
-            # 1. 获取聊天流印象数据
-            stream_data = await self._get_stream_impression(stream_id)
+            # 1-4. 印象数据、最近聊天记录、bot人设、当前心情互不依赖，并发获取
+            stream_data, recent_chat_history, bot_personality, current_mood = await asyncio.gather(
+                self._get_stream_impression(stream_id),
+                self._get_recent_chat_history(stream_id),
+                get_individuality().get_personality_block(),
+                self._get_current_mood(stream_id),
+            )
             if not stream_data:
                 logger.warning(f"无法获取聊天流 {stream_id} 的印象数据")
                 return None
 
-            # 2. 获取最近的聊天记录
-            recent_messages = await message_api.get_recent_messages(
-                chat_id=stream_id,
-                limit=40,
-                limit_mode="latest",
-                hours=24
-            )
-
-            recent_chat_history = ""
-            if recent_messages:
-                recent_chat_history = await message_api.build_readable_messages_to_str(recent_messages)
-
-            # 3. 获取bot人设和时间信息
-            individuality = Individuality()
-            bot_personality = await individuality.get_personality_block()
-
             # 构建时间信息块
             time_block = f"当前时间是 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-            # 4. 获取当前心情
-            current_mood = "感觉很平静"  # 默认心情
-            try:
-                from src.mood.mood_manager import mood_manager
-
-                mood_obj = mood_manager.get_mood_by_chat_id(stream_id)
-                if mood_obj:
-                    await mood_obj._initialize()  # 确保已初始化
-                    current_mood = mood_obj.mood_state
-                    logger.debug(f"获取到聊天流 {stream_id} 的心情: {current_mood}")
-            except Exception as e:
-                logger.warning(f"获取心情失败，使用默认值: {e}")
-
             # 5. 获取上次决策
             last_decision = None
             try:
@@ -232,7 +210,7 @@ class ProactiveThinkingPlanner:
 
                 last_decision = proactive_thinking_scheduler.get_last_decision(stream_id)
                 if last_decision:
-                    logger.debug(f"获取到聊天流 {stream_id} 的上次决策: {last_decision.get('action')}")
+                    logger.debug("获取到聊天流 %s 的上次决策: %s", stream_id, last_decision.get("action"))
             except Exception as e:
                 logger.warning(f"获取上次决策失败: {e}")
 
@@ -251,13 +229,42 @@ class ProactiveThinkingPlanner:
                 "last_decision": last_decision,
             }
 
-            logger.debug(f"成功搜集聊天流 {stream_id} 的上下文信息")
+            logger.debug("成功搜集聊天流 %s 的上下文信息", stream_id)
             return context
 
         except Exception as e:
             logger.error(f"搜集上下文信息失败: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    async def _get_recent_chat_history(stream_id: str) -> str:
+        """获取最近的聊天记录并格式化为可读文本"""
+        recent_messages = await message_api.get_recent_messages(
+            chat_id=stream_id,
+            limit=40,
+            limit_mode="latest",
+            hours=24
+        )
+        if not recent_messages:
+            return ""
+        return await message_api.build_readable_messages_to_str(recent_messages)
+
+    @staticmethod
+    async def _get_current_mood(stream_id: str) -> str:
+        """获取聊天流当前心情，失败时返回默认心情"""
+        current_mood = "感觉很平静"  # 默认心情
+        try:
+            from src.mood.mood_manager import mood_manager
+
+            mood_obj = mood_manager.get_mood_by_chat_id(stream_id)
+            if mood_obj:
+                await mood_obj._initialize()  # 确保已初始化
+                current_mood = mood_obj.mood_state
+                logger.debug("获取到聊天流 %s 的心情: %s", stream_id, current_mood)
+        except Exception as e:
+            logger.warning(f"获取心情失败，使用默认值: {e}")
+        return current_mood
+
     @cached(ttl=300, key_prefix="stream_impression")  # 缓存5分钟
     async def _get_stream_impression(self, stream_id: str) -> dict[str, Any] | None:
         """从数据库获取聊天流印象数据（带5分钟缓存）"""
@@ -345,7 +352,7 @@ class ProactiveThinkingPlanner:
             if not decision or not isinstance(decision, dict):
                 logger.error("解析决策JSON失败")
                 if response:
-                    logger.debug(f"原始响应: {response[:500]}")
+                    logger.debug("原始响应: %.500s", response)
                 return None
 
             logger.info(f"决策结果: {decision.get('action', 'unknown')} - {decision.get('reasoning', '无理由')}")
@@ -416,10 +423,11 @@ class ProactiveThinkingPlanner:
 
             # 应用格式过滤器，确保回复内容不包含系统格式化文本
             from src.chat.utils.utils import filter_system_format_content
-            filtered_response = filter_system_format_content(response.strip())
+            stripped_response = response.strip()
+            filtered_response = filter_system_format_content(stripped_response)
 
-            if filtered_response != response.strip():
-                logger.debug(f"主动思考回复已过滤系统格式: '{response.strip()}' -> '{filtered_response}'")
+            if filtered_response != stripped_response:
+                logger.debug("主动思考回复已过滤系统格式: '%s' -> '%s'", stripped_response, filtered_response)
 
             return filtered_response
 
@@ -539,7 +547,7 @@ async def execute_proactive_thinking(stream_id: str):
 
     # 首先检查总开关
     if not config.enable:
-        logger.debug(f"主动思考功能已关闭，跳过执行 {stream_id}")
+        logger.debug("主动思考功能已关闭，跳过执行 %s", stream_id)
         return
 
     # 获取或创建该聊天流的执行锁
@@ -554,16 +562,21 @@ async def execute_proactive_thinking(stream_id: str):
         return
 
     async with lock:
-        logger.debug(f"🤔 开始主动思考 {stream_id}")
+        logger.debug("🤔 开始主动思考 %s", stream_id)
 
         try:
             # 0. 前置检查
-            # 0.0 检查聊天流是否正在处理消息（双重保护）
+            # 聊天流只解析一次，供下面的各项检查共用
+            chat_stream = None
             try:
                 from src.chat.message_receive.chat_stream import get_chat_manager
-                chat_manager = get_chat_manager()
-                chat_stream = await chat_manager.get_stream(stream_id)
 
+                chat_stream = await get_chat_manager().get_stream(stream_id)
+            except Exception as e:
+                logger.warning(f"获取聊天流 {stream_id} 时出错: {e}，继续执行")
+
+            # 0.0 检查聊天流是否正在处理消息（双重保护）
+            try:
                 if chat_stream and chat_stream.context_manager.context.is_chatter_processing:
                     logger.warning(f"⚠️ 主动思考跳过：聊天流 {stream_id} 的 chatter 正在处理消息")
                     return
@@ -571,19 +584,15 @@ async def execute_proactive_thinking(stream_id: str):
                 logger.warning(f"检查 chatter 处理状态时出错: {e}，继续执行")
 
             # 0.1 检查白名单/黑名单
-            # 从 stream_id 获取 stream_config 字符串进行验证
+            # 从聊天流获取 stream_config 字符串进行验证
             try:
-                from src.chat.message_receive.chat_stream import get_chat_manager
-                chat_manager = get_chat_manager()
-                chat_stream = await chat_manager.get_stream(stream_id)
-
                 if chat_stream:
                     # 使用 ChatStream 的 get_raw_id() 方法获取配置字符串
                     stream_config = chat_stream.get_raw_id()
 
                     # 执行白名单/黑名单检查
                     if not proactive_thinking_scheduler._check_whitelist_blacklist(stream_config):
-                        logger.debug(f"聊天流 {stream_id} ({stream_config}) 未通过白名单/黑名单检查，跳过主动思考")
+                        logger.debug("聊天流 %s (%s) 未通过白名单/黑名单检查，跳过主动思考", stream_id, stream_config)
                         return
                 else:
                     logger.warning(f"无法获取聊天流 {stream_id} 的信息，跳过白名单检查")
@@ -625,11 +634,11 @@ async def execute_proactive_thinking(stream_id: str):
 
             # 记录决策日志
             if config.log_decisions:
-                logger.debug(f"决策: action={action}, reasoning={reasoning}")
+                logger.debug("决策: action=%s, reasoning=%s", action, reasoning)
 
             # 3. 根据决策执行相应动作
             if action == "do_nothing":
-                logger.debug(f"决策：什么都不做。理由：{reasoning}")
+                logger.debug("决策：什么都不做。理由：%s", reasoning)
                 proactive_thinking_scheduler.record_decision(stream_id, action, reasoning, None)
                 return
 
@@ -84,13 +84,14 @@ class ProactiveThinkingScheduler:
         Returns:
             bool: True表示允许主动思考，False表示拒绝
         """
-        # 解析类型
-        parts = stream_config.split(":")
-        if len(parts) != 3:
+        # 解析类型（partition 链代替 split，不必为三段分配列表）
+        _, sep1, rest = stream_config.partition(":")
+        _, sep2, stream_type = rest.partition(":")
+        if not sep1 or not sep2 or ":" in stream_type:
             logger.warning(f"无效的stream_config格式: {stream_config}")
             return False
 
-        is_private = parts[2] == "private"
+        is_private = stream_type == "private"
 
         # 黑名单检查（优先级高）
         if self.config.blacklist_mode:
@@ -4,12 +4,19 @@
 定义插件配置、组件和权限
 """
 
+from src.chat.security import get_security_manager
+from src.common.logger import get_logger
 from src.plugin_system import (
     BasePlugin,
     ConfigField,
     register_plugin,
 )
 
+from .checker import AntiInjectionChecker
+from .prompts import AntiInjectionPrompt, SecurityStatusPrompt
+
+logger = get_logger("anti_injection_plugin")
+
 
 @register_plugin
 class AntiInjectionPlugin(BasePlugin):
@@ -59,8 +66,8 @@ class AntiInjectionPlugin(BasePlugin):
             "whitelist": ConfigField(
                 type=list,
                 default=[],
-                description="白名单用户列表（这些用户的消息不会被检测）",
-                example='["user123", "admin456"]',
+                description="白名单用户列表（这些用户的消息不会被检测），格式: [[platform, user_id], ...]",
+                example='[["qq", "123456"], ["telegram", "admin456"]]',
             ),
         },
         "processing": {
@@ -117,15 +124,33 @@ class AntiInjectionPlugin(BasePlugin):
                 default=True,
                 description="是否启用检测统计",
             ),
+            "llm_batch_window_ms": ConfigField(
+                type=int,
+                default=50,
+                description="LLM检测攒批时间窗口（毫秒），同一用户并发到达的消息合并为一次请求；每条消息最多因此额外等待该时长",
+            ),
+            "llm_batch_max_size": ConfigField(
+                type=int,
+                default=8,
+                description="LLM检测单批最大消息数，攒满立即发送；设为1则逐条请求",
+            ),
         },
     }
 
+    # 组件列表缓存及其对应的配置对象
+    # 配置每次加载都会整体替换 self.config（见 PluginBase._load_plugin_config），按对象身份比较即可在重载后失效
+    _components_cache: tuple | None = None
+    _components_config_source: dict | None = None
+
     def get_plugin_components(self):
-        """注册插件的所有功能组件"""
-        components = []
+        """注册插件的所有功能组件
+
+        组件列表只依赖当前配置，构建一次后缓存为不可变元组，直到配置对象被替换
+        """
+        if self._components_cache is not None and self._components_config_source is self.config:
+            return self._components_cache
 
-        # 导入Prompt组件
-        from .prompts import AntiInjectionPrompt
+        components = []
 
         # 总是注册安全提示词（核心功能）
         components.append(
@@ -134,23 +159,16 @@ class AntiInjectionPlugin(BasePlugin):
 
         # 根据配置决定是否注册调试用的状态提示词
         if self.get_config("performance.stats_enabled", False):
-            from .prompts import SecurityStatusPrompt
-
             components.append(
                 (SecurityStatusPrompt.get_prompt_info(), SecurityStatusPrompt)
             )
 
-        return components
+        self._components_cache = tuple(components)
+        self._components_config_source = self.config
+        return self._components_cache
 
     async def on_plugin_loaded(self):
         """插件加载完成后的初始化"""
-        from src.chat.security import get_security_manager
-        from src.common.logger import get_logger
-
-        from .checker import AntiInjectionChecker
-
-        logger = get_logger("anti_injection_plugin")
-
         # 注册安全检查器到核心系统
         security_manager = get_security_manager()
         checker = AntiInjectionChecker(config=self.config)
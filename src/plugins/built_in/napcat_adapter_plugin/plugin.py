@@ -1,5 +1,6 @@
 import asyncio
 import inspect
+import logging
 import orjson
 from typing import ClassVar, List
 
@@ -19,7 +20,7 @@ from .src.recv_handler.meta_event_handler import meta_event_handler
 from .src.recv_handler.notice_handler import notice_handler
 from .src.response_pool import check_timeout_response, put_response
 from .src.send_handler import send_handler
-from .src.stream_router import stream_router
+from .src.stream_router import ROUTED_POST_TYPES, stream_router
 from .src.websocket_manager import websocket_manager
 
 logger = get_logger("napcat_adapter")
@@ -40,11 +41,13 @@ async def message_recv(server_connection: Server.ServerConnection):
     await message_handler.set_server_connection(server_connection)
     asyncio.create_task(notice_handler.set_server_connection(server_connection))
     await send_handler.set_server_connection(server_connection)
+    # 每个连接只判断一次是否启用DEBUG，避免逐帧检查日志级别
+    # 注意: logger.level 是本logger自身的级别(默认NOTSET=0)，不能代表实际生效级别
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     async for raw_message in server_connection:
         # 只在debug模式下记录原始消息
-        if logger.level <= 10:  # DEBUG level
+        if debug_enabled:
             logger.debug(f"{raw_message[:1500]}..." if (len(raw_message) > 1500) else raw_message)
-        decoded_raw_message: dict = orjson.loads(raw_message)
         try:
             # 首先尝试解析原始消息
             decoded_raw_message: dict = orjson.loads(raw_message)
@@ -65,7 +68,7 @@ async def message_recv(server_connection: Server.ServerConnection):
 
             # 处理完整消息（可能是重组后的，也可能是原本就完整的）
             post_type = decoded_raw_message.get("post_type")
-            if post_type in ["meta_event", "message", "notice"]:
+            if post_type in ROUTED_POST_TYPES:
                 # 使用流路由器路由消息到对应的聊天流
                 await stream_router.route_message(decoded_raw_message)
             elif post_type is None:
@@ -16,12 +16,20 @@ from src.common.logger import get_logger
 
 logger = get_logger("stream_router")
 
+# 需要经流路由器分发的上报类型（每条入站消息都会做一次成员判断，预先构建为 frozenset）
+ROUTED_POST_TYPES = frozenset({"meta_event", "message", "notice"})
+# 按聊天分流的上报类型，其余类型统一进入系统流
+STREAM_POST_TYPES = frozenset({"message", "notice"})
+
 
 class StreamConsumer:
     """单个聊天流的消息消费者
     
     维护独立的消息队列和处理协程
+    每个活跃聊天流一个实例，使用 __slots__ 减少内存占用并加快属性访问
     """
+
+    __slots__ = ("stream_id", "queue", "worker_task", "last_active_time", "is_running", "stats")
     
     def __init__(self, stream_id: str, queue_maxsize: int = 100):
         self.stream_id = stream_id
@@ -54,6 +62,14 @@ class StreamConsumer:
             except asyncio.CancelledError:
                 pass
         logger.debug(f"Stream Consumer 停止: {self.stream_id}")
+
+    async def __aenter__(self) -> "StreamConsumer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.stop()
+        return False
     
     async def enqueue(self, message: dict) -> None:
         """将消息加入队列"""
@@ -89,11 +105,15 @@ class StreamConsumer:
         try:
             while self.is_running:
                 try:
-                    # 等待消息，1秒超时
-                    message = await asyncio.wait_for(
-                        self.queue.get(),
-                        timeout=1.0
-                    )
+                    try:
+                        # 突发时队列里已有积压，直接连续取出，不为每条消息创建超时等待
+                        message = self.queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        # 队列为空时才等待新消息，1秒超时
+                        message = await asyncio.wait_for(
+                            self.queue.get(),
+                            timeout=1.0
+                        )
                     
                     start_time = time.time()
                     
@@ -125,10 +145,9 @@ class StreamConsumer:
                             f"平均耗时={avg_time:.3f}秒, "
                             f"队列长度={self.queue.qsize()}"
                         )
-                    
-                    # 动态延迟：队列空时短暂休眠
-                    if self.queue.qsize() == 0:
-                        await asyncio.sleep(0.01)
+
+                    # 每处理一条消息让出一次控制权，避免积压排空时独占事件循环
+                    await asyncio.sleep(0)
                 
                 except asyncio.TimeoutError:
                     # 超时是正常的，继续循环
@@ -167,6 +186,15 @@ class StreamRouter:
     
     负责将消息路由到对应的聊天流队列
     动态管理聊天流的生命周期
+
+    启动与停止在同一作用域内时，推荐使用异步上下文管理器，
+    异常或取消时也能保证 stop() 被调用：
+
+        async with StreamRouter() as router:
+            await router.route_message(message)
+
+    插件中全局 stream_router 的启动与关闭分属 ON_START 处理器和 graceful_shutdown，
+    因此仍显式调用 start()/stop()。
     """
     
     def __init__(
@@ -215,6 +243,14 @@ class StreamRouter:
         
         self.streams.clear()
         logger.info("StreamRouter 已停止")
+
+    async def __aenter__(self) -> "StreamRouter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.stop()
+        return False
     
     async def route_message(self, message: dict) -> None:
         """路由消息到对应的流"""
@@ -260,7 +296,7 @@ class StreamRouter:
         post_type = message.get("post_type")
         
         # 非消息类型，使用默认流（避免创建过多流）
-        if post_type not in ["message", "notice"]:
+        if post_type not in STREAM_POST_TYPES:
             return "system:meta_event"
         
         # 消息类型
@@ -28,6 +28,9 @@ from src.plugin_system.utils.permission_decorators import require_permission
 
 logger = get_logger("SystemManagement")
 
+# 用户提及格式 @<昵称:QQ号>，模块加载时编译一次
+_USER_MENTION_RE = re.compile(r"@<[^:]+:(\d+)>")
+
 
 class SystemCommand(PlusCommand):
     """系统管理命令 - 使用PlusCommand系统"""
@@ -39,8 +42,24 @@ class SystemCommand(PlusCommand):
     chat_type_allow = ChatType.ALL
     intercept_message = True
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # 子命令别名 -> 处理方法名（类定义时构建一次，分派时只需一次字典查找）
+    _SUBCOMMAND_HANDLERS: ClassVar[dict[str, str]] = {
+        **dict.fromkeys(("permission", "perm", "权限"), "_handle_permission_commands"),
+        **dict.fromkeys(("plugin", "插件"), "_handle_plugin_commands"),
+        **dict.fromkeys(("schedule", "定时任务"), "_handle_schedule_commands"),
+        **dict.fromkeys(("prompt", "提示词"), "_handle_prompt_commands"),
+    }
+    _HELP_ALIASES: ClassVar[frozenset[str]] = frozenset({"help", "帮助"})
+
+    # 权限子命令别名 -> 处理方法名，处理方法签名统一为 (chat_info, args)
+    _PERMISSION_ACTIONS: ClassVar[dict[str, str]] = {
+        **dict.fromkeys(("grant", "授权", "give"), "_grant_permission"),
+        **dict.fromkeys(("revoke", "撤销", "remove"), "_revoke_permission"),
+        **dict.fromkeys(("list", "列表", "ls"), "_list_permissions"),
+        **dict.fromkeys(("check", "检查"), "_check_permission"),
+        **dict.fromkeys(("nodes", "节点"), "_list_nodes"),
+        **dict.fromkeys(("allnodes", "全部节点", "all"), "_list_all_nodes_with_description"),
+    }
 
     @require_permission("access", deny_message="❌ 你没有权限使用此命令")
     async def execute(self, args: CommandArgs) -> tuple[bool, str | None, bool]:
@@ -52,16 +71,11 @@ class SystemCommand(PlusCommand):
         subcommand = args.get_first.lower()
         remaining_args = args.get_args()[1:]
 
-        if subcommand in ["permission", "perm", "权限"]:
-            await self._handle_permission_commands(remaining_args)
-        elif subcommand in ["plugin", "插件"]:
-            await self._handle_plugin_commands(remaining_args)
-        elif subcommand in ["schedule", "定时任务"]:
-            await self._handle_schedule_commands(remaining_args)
-        elif subcommand in ["help", "帮助"]:
+        handler_name = self._SUBCOMMAND_HANDLERS.get(subcommand)
+        if handler_name is not None:
+            await getattr(self, handler_name)(remaining_args)
+        elif subcommand in self._HELP_ALIASES:
             await self._show_help("all")
-        elif subcommand in ["prompt","提示词"]:
-            await self._handle_prompt_commands(remaining_args)
         else:
             await self.send_text(f"❌ 未知的子命令: {subcommand}\n使用 /system help 查看帮助")
 
@@ -412,25 +426,16 @@ class SystemCommand(PlusCommand):
         remaining_args = args[1:]
         chat_info = self.message.chat_info
 
-        if action in ["grant", "授权", "give"]:
-            await self._grant_permission(chat_info, remaining_args)
-        elif action in ["revoke", "撤销", "remove"]:
-            await self._revoke_permission(chat_info, remaining_args)
-        elif action in ["list", "列表", "ls"]:
-            await self._list_permissions(chat_info, remaining_args)
-        elif action in ["check", "检查"]:
-            await self._check_permission(chat_info, remaining_args)
-        elif action in ["nodes", "节点"]:
-            await self._list_nodes(chat_info, remaining_args)
-        elif action in ["allnodes", "全部节点", "all"]:
-            await self._list_all_nodes_with_description(chat_info)
-        else:
+        handler_name = self._PERMISSION_ACTIONS.get(action)
+        if handler_name is None:
             await self.send_text(f"❌ 未知的权限子命令: {action}")
+            return
+        await getattr(self, handler_name)(chat_info, remaining_args)
 
     @staticmethod
     def _parse_user_mention(mention: str) -> str | None:
         """解析用户提及，提取QQ号"""
-        at_match = re.search(r"@<[^:]+:(\d+)>", mention)
+        at_match = _USER_MENTION_RE.search(mention)
         if at_match:
             return at_match.group(1)
         if mention.isdigit():
@@ -487,12 +492,11 @@ class SystemCommand(PlusCommand):
         else:
             target_user_id = chat_info.user_info.user_id
 
-        is_master = await permission_api.is_master(chat_info.platform, target_user_id)
-        permissions = await permission_api.get_user_permissions(chat_info.platform, target_user_id)
-
-        if is_master:
+        if await permission_api.is_master(chat_info.platform, target_user_id):
             response = f"👑 用户 `{target_user_id}` 是Master用户，拥有所有权限"
         else:
+            # 仅非Master用户才需要查询权限列表（Master的查询会扫描全部节点，结果也用不上）
+            permissions = await permission_api.get_user_permissions(chat_info.platform, target_user_id)
             if permissions:
                 perm_list = "\n".join([f"• `{perm}`" for perm in permissions])
                 response = f"📋 用户 `{target_user_id}` 拥有的权限：\n{perm_list}"
@@ -514,11 +518,11 @@ class SystemCommand(PlusCommand):
 
         permission_node = args[1]
         has_permission = await permission_api.check_permission(chat_info.platform, user_id, permission_node)
-        is_master = await permission_api.is_master(chat_info.platform, user_id)
 
         if has_permission:
             response = f"✅ 用户 `{user_id}` 拥有权限 `{permission_node}`"
-            if is_master:
+            # Master标记只在拥有权限时展示，无权限时无需判断
+            if await permission_api.is_master(chat_info.platform, user_id):
                 response += "（Master用户）"
         else:
             response = f"❌ 用户 `{user_id}` 没有权限 `{permission_node}`"
@@ -538,19 +542,20 @@ class SystemCommand(PlusCommand):
         if not nodes:
             response = f"📋 插件 {plugin_name} 没有注册任何权限节点" if plugin_name else "📋 系统中没有任何权限节点"
         else:
-            node_list = []
-            for node in nodes:
+
+            def _format_node(node: dict) -> str:
                 default_text = "（默认授权）" if node["default_granted"] else "（默认拒绝）"
-                node_list.append(f"• {node['node_name']} {default_text}")
-                node_list.append(f"  📄 {node['description']}")
+                entry = f"• {node['node_name']} {default_text}\n  📄 {node['description']}"
                 if not plugin_name:
-                    node_list.append(f"  🔌 插件: {node['plugin_name']}")
-                node_list.append("")
-            response = title + "\n" + "\n".join(node_list)
+                    entry += f"\n  🔌 插件: {node['plugin_name']}"
+                return entry
+
+            # 每个节点格式化为一段，段间空行分隔，一次 join 生成最终文本
+            response = title + "\n" + "\n\n".join(_format_node(node) for node in nodes)
         await self.send_text(response)
 
     @require_permission("permission.view", deny_message="❌ 你没有查看权限的权限")
-    async def _list_all_nodes_with_description(self, chat_stream):
+    async def _list_all_nodes_with_description(self, chat_info, args: list[str]):
         """列出所有插件的权限节点（带详细描述）"""
         all_nodes = await permission_api.get_all_permission_nodes()
         if not all_nodes:
@@ -205,28 +205,33 @@ async def get_smart_plans_for_daily_schedule(month: str, max_count: int = 3, avo
             # 计算避免重复的日期阈值
             avoid_date = (datetime.now() - timedelta(days=avoid_days)).strftime("%Y-%m-%d")
 
-            # 查询符合条件的计划
-            query = select(MonthlyPlan).where(MonthlyPlan.target_month == month, MonthlyPlan.status == "active")
+            # 查询符合条件的计划（只取ID，候选计划可能很多，不必为每一行构造完整的ORM对象）
+            query = select(MonthlyPlan.id).where(MonthlyPlan.target_month == month, MonthlyPlan.status == "active")
 
             # 排除最近使用过的计划
             query = query.where((MonthlyPlan.last_used_date.is_(None)) | (MonthlyPlan.last_used_date < avoid_date))
 
-            # 按使用次数升序排列，优先选择使用次数少的
-            result = await session.execute(query.order_by(MonthlyPlan.usage_count.asc()))
-            plans = result.scalars().all()
+            result = await session.execute(query)
+            plan_ids = result.scalars().all()
 
-            if not plans:
+            if not plan_ids:
                 logger.info(f"没有找到符合条件的 {month} 月度计划。")
                 return []
 
             # 如果计划数量超过需要的数量，进行随机抽取
-            if len(plans) > max_count:
+            if len(plan_ids) > max_count:
                 import random
 
-                plans = random.sample(plans, max_count)
+                plan_ids = random.sample(plan_ids, max_count)
+
+            # 只加载被抽中的计划，按使用次数升序排列，优先展示使用次数少的
+            result = await session.execute(
+                select(MonthlyPlan).where(MonthlyPlan.id.in_(plan_ids)).order_by(MonthlyPlan.usage_count.asc())
+            )
+            plans = list(result.scalars().all())
 
             logger.info(f"智能抽取了 {len(plans)} 条 {month} 的月度计划用于每日日程生成。")
-            return list(plans)
+            return plans
 
         except Exception as e:
             logger.error(f"智能抽取 {month} 的月度计划时发生错误: {e}")
@@ -1,17 +1,23 @@
 # mmc/src/schedule/llm_generator.py
 
 import asyncio
+import functools
+import itertools
+import random
+import re
 from datetime import datetime
 from typing import Any
 
 import orjson
 from json_repair import repair_json
 from lunar_python import Lunar
+from pydantic import ValidationError
 
 from src.chat.utils.prompt import global_prompt_manager
 from src.common.database.core.models import MonthlyPlan
 from src.common.logger import get_logger
 from src.config.config import global_config, model_config
+from src.llm_models.exceptions import RespNotOkException
 from src.llm_models.utils_model import LLMRequest
 
 from .prompts import DEFAULT_MONTHLY_PLAN_GUIDELINES, DEFAULT_SCHEDULE_GUIDELINES
@@ -19,17 +25,113 @@ from .schemas import ScheduleData
 
 logger = get_logger("schedule_llm_generator")
 
+# 日程提示词中 failure_hint 的占位标记：提示词只渲染一次，重试时仅替换该标记
+_FAILURE_HINT_MARKER = "\x00failure_hint\x00"
+
+# 星期名称（与 C locale 下 strftime("%A") 的输出一致），按 date.weekday() 索引
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# 月度计划响应中需要跳过的 Markdown 标记/分隔线（一次正则扫描代替逐个子串查找）
+_PLAN_MARKER_RE = re.compile(r"\*\*|##|```|---|===")
+# 不是计划内容的解释性句子前缀
+_PLAN_SKIP_PREFIXES = ("请", "以上", "总结", "注意")
+
+
+# 按请求类型共享的 LLM 请求处理器；底层 HTTP 连接池已由模型客户端全局复用
+_llm_requests: dict[str, LLMRequest] = {}
+
+
+def _get_llm_request(request_type: str) -> LLMRequest:
+    """
+    获取（必要时创建）日程模型的 LLM 请求处理器，同一请求类型的生成器实例共享同一个。
+
+    Args:
+        request_type (str): 请求类型，用于日志和用量记录。
+
+    Returns:
+        LLMRequest: 共享的 LLM 请求处理器。
+    """
+    llm = _llm_requests.get(request_type)
+    if llm is None:
+        llm = LLMRequest(model_set=model_config.model_task_config.schedule_generator, request_type=request_type)
+        _llm_requests[request_type] = llm
+    return llm
+
+
+@functools.lru_cache(maxsize=32)
+def _festival_block_for(today_str: str) -> str:
+    """
+    构建指定日期的节日提示块（按日期缓存，同一天内只计算一次农历信息）。
+
+    Args:
+        today_str (str): 日期字符串，格式 "YYYY-MM-DD"。
+
+    Returns:
+        str: 节日提示块，当天没有节日时为空字符串。
+    """
+    # 使用 lunar_python 库获取农历和节日信息
+    lunar = Lunar.fromDate(datetime.fromisoformat(today_str))
+    festivals = lunar.getFestivals()
+    other_festivals = lunar.getOtherFestivals()
+    # 绝大多数日子没有节日，直接返回空串
+    if not festivals and not other_festivals:
+        return ""
+    festival_text = "、".join(itertools.chain(festivals, other_festivals))
+    return f"**今天也是一个特殊的日子: {festival_text}！请在日程中考虑和庆祝这个节日。**"
+
+
+def _is_rate_limited(error: BaseException | None) -> bool:
+    """
+    判断异常链中是否包含 429 限流响应。
+
+    LLMRequest 会把底层异常包装为 RuntimeError 再抛出，因此沿 __cause__/__context__ 逐层查找。
+
+    Args:
+        error (BaseException | None): 捕获到的异常。
+
+    Returns:
+        bool: 是否为限流错误。
+    """
+    seen: set[int] = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, RespNotOkException) and error.status_code == 429:
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _retry_delay(attempt: int, error: Exception | None) -> float:
+    """
+    计算第 attempt 次失败后的重试等待时间（指数退避 + 全抖动）。
+
+    限流错误（429 / rate limit）使用完整的指数退避上限；超时、网络错误或
+    生成内容不合格等瞬时问题只做短暂退避，尽快重试。
+
+    Args:
+        attempt (int): 已失败的尝试次数（从 1 开始）。
+        error (Exception | None): 本次失败的异常，内容验证失败时为 None。
+
+    Returns:
+        float: 等待秒数。
+    """
+    max_delay = min(8.0, 0.5 * 2**attempt)
+    if not _is_rate_limited(error):
+        max_delay = min(max_delay, 1.0)
+    return random.uniform(0, max_delay)
+
 
 class ScheduleLLMGenerator:
     """
     使用大型语言模型（LLM）生成每日日程。
     """
+
     def __init__(self):
         """
         初始化 ScheduleLLMGenerator。
         """
-        # 根据配置初始化 LLM 请求处理器
-        self.llm = LLMRequest(model_set=model_config.model_task_config.schedule_generator, request_type="schedule")
+        # 根据配置获取共享的 LLM 请求处理器
+        self.llm = _get_llm_request("schedule")
 
     async def generate_schedule_with_llm(self, sampled_plans: list[MonthlyPlan]) -> list[dict[str, Any]] | None:
         """
@@ -41,21 +143,12 @@ class ScheduleLLMGenerator:
         Returns:
             list[dict[str, Any]] | None: 成功生成并验证后的日程数据，或在失败时返回 None。
         """
-        now = datetime.now()
-        today_str = now.strftime("%Y-%m-%d")
-        weekday = now.strftime("%A")
-
-        # 使用 lunar_python 库获取农历和节日信息
-        lunar = Lunar.fromDate(now)
-        festivals = lunar.getFestivals()
-        other_festivals = lunar.getOtherFestivals()
-        all_festivals = festivals + other_festivals
+        today = datetime.now().date()
+        today_str = today.isoformat()
+        weekday = _WEEKDAYS[today.weekday()]
 
         # 构建节日信息提示块
-        festival_block = ""
-        if all_festivals:
-            festival_text = "、".join(all_festivals)
-            festival_block = f"**今天也是一个特殊的日子: {festival_text}！请在日程中考虑和庆祝这个节日。**"
+        festival_block = _festival_block_for(today_str)
 
         # 构建月度计划参考提示块
         monthly_plans_block = ""
@@ -68,8 +161,10 @@ class ScheduleLLMGenerator:
 
         guidelines = global_config.planning_system.schedule_guidelines or DEFAULT_SCHEDULE_GUIDELINES
 
+        base_prompt = None
         max_retries = 3
         for attempt in range(1, max_retries + 1):
+            last_error = None
             try:
                 logger.info(f"正在生成日程 (第 {attempt}/{max_retries} 次尝试)")
 
@@ -83,57 +178,99 @@ class ScheduleLLMGenerator:
 - 不要输出任何解释文字，只输出纯JSON数组
 - 确保输出完整，不要被截断
 """
-                prompt = await global_prompt_manager.format_prompt(
-                    "schedule_generation",
-                    bot_nickname=global_config.bot.nickname,
-                    today_str=today_str,
-                    weekday=weekday,
-                    festival_block=festival_block,
-                    personality=global_config.personality.personality_core,
-                    personality_side=global_config.personality.personality_side,
-                    monthly_plans_block=monthly_plans_block,
-                    guidelines=guidelines,
-                    failure_hint=failure_hint,
-                )
+                # 除 failure_hint 外的参数在各次尝试间相同，提示词只渲染一次
+                if base_prompt is None:
+                    base_prompt = await global_prompt_manager.format_prompt(
+                        "schedule_generation",
+                        bot_nickname=global_config.bot.nickname,
+                        today_str=today_str,
+                        weekday=weekday,
+                        festival_block=festival_block,
+                        personality=global_config.personality.personality_core,
+                        personality_side=global_config.personality.personality_side,
+                        monthly_plans_block=monthly_plans_block,
+                        guidelines=guidelines,
+                        failure_hint=_FAILURE_HINT_MARKER,
+                    )
+                prompt = base_prompt.replace(_FAILURE_HINT_MARKER, failure_hint)
 
                 response, _ = await self.llm.generate_response_async(prompt)
-                # 使用 json_repair 修复可能不规范的 JSON 字符串
-                schedule_data = orjson.loads(repair_json(response))
 
-                # 使用 Pydantic 模型验证修复后的 JSON 数据
-                if self._validate_schedule_with_pydantic(schedule_data):
+                # 快速路径：由 Pydantic 直接解析并验证 JSON 文本，不经过中间 dict；
+                # 响应本身就是合法 JSON 时连 json_repair 的纯 Python 逐字符修复也一并省去
+                schedule_data, json_valid = self._validate_schedule_json(response.strip())
+                if schedule_data is None and not json_valid:
+                    # 使用 json_repair 修复可能不规范的 JSON 字符串
+                    # skip_json_loads 跳过 json_repair 内部的标准库 json.loads 预解析
+                    repaired = repair_json(response, skip_json_loads=True)
+                    schedule_data, json_valid = self._validate_schedule_json(repaired)
+
+                    # 修复后的文本仍不是合法 JSON 时，回退到先解析为对象再验证
+                    if schedule_data is None and not json_valid:
+                        try:
+                            parsed_data = orjson.loads(repaired)
+                        except orjson.JSONDecodeError:
+                            parsed_data = repair_json(response, return_objects=True)
+                        schedule_data = self._validate_schedule_data(parsed_data)
+
+                if schedule_data is not None:
                     return schedule_data
-                else:
-                    logger.warning(f"第 {attempt} 次生成的日程验证失败，继续重试...")
+
+                logger.warning(f"第 {attempt} 次生成的日程验证失败，继续重试...")
 
             except Exception as e:
                 logger.error(f"第 {attempt} 次生成日程失败: {e}")
+                last_error = e
 
-            if attempt < max_retries:
-                logger.info("2秒后继续重试...")
-                await asyncio.sleep(2)
+            # 最后一次尝试失败后直接结束，不再计算退避
+            if attempt == max_retries:
+                break
+            delay = _retry_delay(attempt, last_error)
+            logger.info(f"{delay:.1f}秒后继续重试...")
+            await asyncio.sleep(delay)
 
         logger.error("所有尝试都失败，无法生成日程，将会在下次启动时自动重试")
         return None
 
     @staticmethod
-    def _validate_schedule_with_pydantic(schedule_data) -> bool:
+    def _validate_schedule_json(schedule_json: str) -> tuple[list[dict[str, Any]] | None, bool]:
+        """
+        使用 Pydantic 直接从 JSON 文本解析并验证日程数据（解析与验证一次完成）。
+
+        Args:
+            schedule_json: 修复后的日程 JSON 数组文本。
+
+        Returns:
+            tuple[list[dict[str, Any]] | None, bool]: (验证通过的日程数据或 None, 文本是否为合法 JSON)。
+        """
+        try:
+            validated = ScheduleData.model_validate_json(f'{{"schedule":{schedule_json}}}')
+        except ValidationError as e:
+            json_valid = all(error["type"] != "json_invalid" for error in e.errors())
+            if json_valid:
+                logger.warning(f"日程数据Pydantic验证失败: {e}")
+            return None, json_valid
+        logger.info("日程数据Pydantic验证通过")
+        return validated.model_dump()["schedule"], True
+
+    @staticmethod
+    def _validate_schedule_data(schedule_data) -> list[dict[str, Any]] | None:
         """
-        使用 Pydantic 模型验证日程数据的格式和内容。
+        使用 Pydantic 模型验证已解析的日程数据，返回与快速路径相同形态的结果。
 
         Args:
             schedule_data: 从 LLM 返回并解析后的日程数据。
 
         Returns:
-            bool: 验证通过返回 True，否则返回 False。
+            list[dict[str, Any]] | None: 验证通过后的日程数据（经模型规范化），失败时返回 None。
         """
         try:
-            ScheduleData(schedule=schedule_data)
-            logger.info("日程数据Pydantic验证通过")
-            return True
+            validated = ScheduleData(schedule=schedule_data)
         except Exception as e:
             logger.warning(f"日程数据Pydantic验证失败: {e}")
-            return False
+            return None
+        logger.info("日程数据Pydantic验证通过")
+        return validated.model_dump()["schedule"]
 
 
 class MonthlyPlanLLMGenerator:
@@ -144,8 +281,8 @@ class MonthlyPlanLLMGenerator:
         """
         初始化 MonthlyPlanLLMGenerator。
         """
-        # 根据配置初始化 LLM 请求处理器
-        self.llm = LLMRequest(model_set=model_config.model_task_config.schedule_generator, request_type="monthly_plan")
+        # 根据配置获取共享的 LLM 请求处理器
+        self.llm = _get_llm_request("monthly_plan")
 
     async def generate_plans_with_llm(self, target_month: str, archived_plans: list[MonthlyPlan]) -> list[str]:
         """
@@ -163,16 +300,17 @@ class MonthlyPlanLLMGenerator:
 
         archived_plans_block = ""
         if archived_plans:
-            archived_texts = [f"- {plan.plan_text}" for plan in archived_plans[:5]]
+            archived_texts = "\n".join([f"- {plan.plan_text}" for plan in itertools.islice(archived_plans, 5)])
             archived_plans_block = f"""
 **上个月未完成的一些计划（可作为参考）**:
-{chr(10).join(archived_texts)}
+{archived_texts}
 
 你可以考虑是否要在这个月继续推进这些计划，或者制定全新的计划。
 """
 
         max_retries = 3
         for attempt in range(1, max_retries + 1):
+            last_error = None
             try:
                 logger.info(f" 正在生成月度计划 (第 {attempt} 次尝试)")
                 prompt = await global_prompt_manager.format_prompt(
@@ -187,7 +325,7 @@ class MonthlyPlanLLMGenerator:
                 )
                 response, _ = await self.llm.generate_response_async(prompt)
                 # 解析返回的纯文本响应
-                plans = self._parse_plans_response(response)
+                plans = self._parse_plans_response(response, max_plans)
                 if plans:
                     logger.info(f"成功生成 {len(plans)} 条月度计划")
                     return plans
@@ -195,41 +333,45 @@ class MonthlyPlanLLMGenerator:
                     logger.warning(f"第 {attempt} 次生成的计划为空，继续重试...")
             except Exception as e:
                 logger.error(f"第 {attempt} 次生成月度计划失败: {e}")
+                last_error = e
 
-            if attempt < max_retries:
-                await asyncio.sleep(2)
+            # 最后一次尝试失败后直接结束，不再计算退避
+            if attempt == max_retries:
+                break
+            await asyncio.sleep(_retry_delay(attempt, last_error))
 
         logger.error(" 所有尝试都失败，无法生成月度计划")
         return []
 
     @staticmethod
-    def _parse_plans_response(response: str) -> list[str]:
+    def _parse_plans_response(response: str, max_plans: int) -> list[str]:
         """
         解析 LLM 返回的纯文本月度计划响应。
 
         Args:
             response (str): LLM 返回的原始字符串。
+            max_plans (int): 最多保留的计划数量。
 
         Returns:
             list[str]: 清理和解析后的计划列表。
         """
         try:
-            response = response.strip()
-            # 按行分割，并去除空行
-            lines = [line.strip() for line in response.split("\n") if line.strip()]
-            plans = []
-            for line in lines:
-                # 过滤掉一些可能的 Markdown 标记或解释性文字
-                if any(marker in line for marker in ["**", "##", "```", "---", "===", "###"]):
+            plans: list[str] = []
+            # 循环内反复用到的方法先绑定到局部变量
+            append = plans.append
+            marker_search = _PLAN_MARKER_RE.search
+            for raw_line in response.split("\n"):
+                line = raw_line.strip()
+                # 去除空行，过滤掉一些可能的 Markdown 标记或解释性文字
+                if not line or marker_search(line):
                     continue
                 # 去除行首的数字、点、短横线等列表标记
                 line = line.lstrip("0123456789.- ")
                 # 过滤掉一些明显不是计划的句子
-                if len(line) > 5 and not line.startswith(("请", "以上", "总结", "注意")):
-                    plans.append(line)
+                if len(line) > 5 and not line.startswith(_PLAN_SKIP_PREFIXES):
+                    append(line)
 
-            # 根据配置限制最大计划数量
-            max_plans = global_config.planning_system.max_plans_per_month
+            # 限制最大计划数量
             if len(plans) > max_plans:
                 plans = plans[:max_plans]
             return plans
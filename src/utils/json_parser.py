@@ -15,6 +15,12 @@ from src.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Markdown 代码块匹配：```json ... ``` 优先，其次 ``` ... ```
+_CODE_BLOCK_PATTERNS = (
+    re.compile(r"```json\s*(.*?)```", re.IGNORECASE | re.DOTALL),
+    re.compile(r"```\s*(.*?)```", re.IGNORECASE | re.DOTALL),
+)
+
 
 def extract_and_parse_json(response: str, *, strict: bool = False) -> dict[str, Any] | list | None:
     """
@@ -48,6 +54,14 @@ def extract_and_parse_json(response: str, *, strict: bool = False) -> dict[str,
         return None
 
     try:
+        # 步骤 0: 快速路径，响应本身就是完整的 JSON 对象时跳过清理和逐字符提取
+        stripped = response.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass
+
         # 步骤 1: 清理响应
         cleaned = _clean_llm_response(response)
 
@@ -120,14 +134,8 @@ def _clean_llm_response(response: str) -> str:
     cleaned = response.strip()
 
     # 移除 Markdown 代码块标记
-    # 匹配 ```json ... ``` 或 ``` ... ```
-    code_block_patterns = [
-        r"```json\s*(.*?)```",  # ```json ... ```
-        r"```\s*(.*?)```",      # ``` ... ```
-    ]
-
-    for pattern in code_block_patterns:
-        match = re.search(pattern, cleaned, re.IGNORECASE | re.DOTALL)
+    for pattern in _CODE_BLOCK_PATTERNS:
+        match = pattern.search(cleaned)
         if match:
             cleaned = match.group(1).strip()
             logger.debug(f"从 Markdown 代码块中提取内容，长度: {len(cleaned)}")
@@ -0,0 +1,160 @@
+"""
+测试记忆图增量日志
+
+验证：
+1. save_delta 追加的记忆和关联边在重启后能回放
+2. 回放的关联边与快照加载一致（进入 Memory.edges 和邻接索引）
+3. 全量快照后增量日志被截断，重启结果不变
+4. 不完整的日志行会被跳过
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.memory_graph.models import EdgeType, Memory, MemoryEdge, MemoryNode, MemoryType, NodeType
+from src.memory_graph.storage.graph_store import GraphStore
+from src.memory_graph.storage.persistence import PersistenceManager
+
+
+def _make_memory(memory_id: str, subject: str, topic: str) -> Memory:
+    """构造一条 主体 -> 主题 的最小记忆"""
+    subject_node = MemoryNode(id=f"{memory_id}_subject", content=subject, node_type=NodeType.SUBJECT)
+    topic_node = MemoryNode(id=f"{memory_id}_topic", content=topic, node_type=NodeType.TOPIC)
+    edge = MemoryEdge(
+        id=f"{memory_id}_edge",
+        source_id=subject_node.id,
+        target_id=topic_node.id,
+        relation="做",
+        edge_type=EdgeType.MEMORY_TYPE,
+    )
+    return Memory(
+        id=memory_id,
+        subject_id=subject_node.id,
+        memory_type=MemoryType.EVENT,
+        nodes=[subject_node, topic_node],
+        edges=[edge],
+    )
+
+
+def _make_link(source: Memory, target: Memory) -> MemoryEdge:
+    """构造两条记忆主题之间的关联边（与 builder.link_memories 相同的形态）"""
+    return MemoryEdge(
+        id=f"link_{source.id}_{target.id}",
+        source_id=f"{source.id}_topic",
+        target_id=f"{target.id}_topic",
+        relation="导致",
+        edge_type=EdgeType.CAUSALITY,
+        metadata={"source_memory_id": source.id, "target_memory_id": target.id},
+    )
+
+
+def _link_view(store: GraphStore, link: MemoryEdge) -> tuple:
+    """提取关联边在邻接索引和 Memory.edges 中的可见情况"""
+    incident = {(e.source_id, e.target_id, e.relation) for e in store.get_incident_edges(link.source_id)}
+    key = (link.source_id, link.target_id, link.relation)
+    owners = sorted(
+        mid
+        for mid, memory in store.memory_index.items()
+        for e in memory.edges
+        if (e.source_id, e.target_id, e.relation) == key
+    )
+    return key in incident, owners
+
+
+async def _write_journal(data_dir: Path) -> MemoryEdge:
+    """模拟一次运行：创建两条记忆并关联，全部只写入增量日志"""
+    manager = PersistenceManager(data_dir=data_dir)
+    store = GraphStore()
+    first = _make_memory("m1", "我", "吃饭")
+    second = _make_memory("m2", "我", "睡觉")
+    link = _make_link(first, second)
+
+    for memory in (first, second):
+        store.add_memory(memory)
+        await manager.save_delta(memory=memory)
+    store.add_edge(link)
+    await manager.save_delta(edge=link)
+    return link
+
+
+def test_journal_replay_matches_snapshot(tmp_path):
+    """重启回放与压缩后重启结果一致"""
+
+    async def run():
+        link = await _write_journal(tmp_path)
+
+        # 首次快照前重启：只从增量日志回放
+        manager = PersistenceManager(data_dir=tmp_path)
+        replayed = await manager.load_graph_store()
+        assert replayed is not None
+        assert set(replayed.memory_index) == {"m1", "m2"}
+        assert manager._journal_entries == 3
+        assert _link_view(replayed, link) == (True, ["m1", "m2"])
+
+        # 压缩：写入全量快照并截断日志
+        await manager.save_graph_store(replayed)
+        assert not manager.journal_file.exists()
+        assert manager._journal_entries == 0
+
+        # 压缩后重启：只从快照加载，结果与回放一致
+        compacted = await PersistenceManager(data_dir=tmp_path).load_graph_store()
+        assert compacted is not None
+        assert _link_view(compacted, link) == (True, ["m1", "m2"])
+        for memory_id, memory in replayed.memory_index.items():
+            assert len(compacted.memory_index[memory_id].edges) == len(memory.edges)
+
+        # 再次压缩和重启不会让同步的边重复累积
+        await PersistenceManager(data_dir=tmp_path).save_graph_store(compacted)
+        reloaded = await PersistenceManager(data_dir=tmp_path).load_graph_store()
+        for memory_id, memory in compacted.memory_index.items():
+            assert len(reloaded.memory_index[memory_id].edges) == len(memory.edges)
+
+    asyncio.run(run())
+
+
+def test_journal_replay_after_snapshot(tmp_path):
+    """快照之后追加的条目在重启时回放到快照之上"""
+
+    async def run():
+        manager = PersistenceManager(data_dir=tmp_path)
+        store = GraphStore()
+        first = _make_memory("m1", "我", "吃饭")
+        store.add_memory(first)
+        await manager.save_graph_store(store)
+
+        second = _make_memory("m2", "我", "睡觉")
+        link = _make_link(first, second)
+        store.add_memory(second)
+        await manager.save_delta(memory=second)
+        store.add_edge(link)
+        await manager.save_delta(edge=link)
+        assert manager.journal_file.exists()
+
+        loaded = await PersistenceManager(data_dir=tmp_path).load_graph_store()
+        assert loaded is not None
+        assert set(loaded.memory_index) == {"m1", "m2"}
+        assert _link_view(loaded, link) == (True, ["m1", "m2"])
+
+    asyncio.run(run())
+
+
+def test_journal_skips_truncated_line(tmp_path):
+    """异常退出留下的不完整行被跳过，其余条目正常回放"""
+
+    async def run():
+        link = await _write_journal(tmp_path)
+        manager = PersistenceManager(data_dir=tmp_path)
+        with manager.journal_file.open("ab") as f:
+            f.write(b'{"op": "memory", "data": {"id": "m3"')
+
+        loaded = await manager.load_graph_store()
+        assert loaded is not None
+        assert set(loaded.memory_index) == {"m1", "m2"}
+        assert manager._journal_entries == 3
+        assert _link_view(loaded, link) == (True, ["m1", "m2"])
+
+    asyncio.run(run())
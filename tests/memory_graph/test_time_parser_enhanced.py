@@ -4,10 +4,87 @@
 验证各种时间表达式的解析能力
 """
 
-from datetime import datetime, timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from src.memory_graph.utils.time_parser import TimeParser
 
+SEPARATOR = "=" * 60
+
+# 测试用例: (时间表达式, 预期描述)
+_TEST_CASES: tuple[tuple[str, str], ...] = (
+    # 相对日期
+    ("今天", "应该是今天0点"),
+    ("明天", "应该是明天0点"),
+    ("昨天", "应该是昨天0点"),
+    ("前天", "应该是前天0点"),
+    ("后天", "应该是后天0点"),
+
+    # X天前/后
+    ("1天前", "应该是昨天0点"),
+    ("2天前", "应该是前天0点"),
+    ("5天前", "应该是5天前0点"),
+    ("3天后", "应该是3天后0点"),
+
+    # X周前/后（新增）
+    ("1周前", "应该是1周前0点"),
+    ("2周前", "应该是2周前0点"),
+    ("3周后", "应该是3周后0点"),
+
+    # X个月前/后（新增）
+    ("1个月前", "应该是约30天前"),
+    ("2月前", "应该是约60天前"),
+    ("3个月后", "应该是约90天后"),
+
+    # X年前/后（新增）
+    ("1年前", "应该是约365天前"),
+    ("2年后", "应该是约730天后"),
+
+    # X小时前/后
+    ("1小时前", "应该是1小时前"),
+    ("3小时前", "应该是3小时前"),
+    ("2小时后", "应该是2小时后"),
+
+    # X分钟前/后
+    ("30分钟前", "应该是30分钟前"),
+    ("15分钟后", "应该是15分钟后"),
+
+    # 时间段
+    ("早上", "应该是今天早上8点"),
+    ("上午", "应该是今天上午10点"),
+    ("中午", "应该是今天中午12点"),
+    ("下午", "应该是今天下午15点"),
+    ("晚上", "应该是今天晚上20点"),
+
+    # 组合表达（新增）
+    ("今天下午", "应该是今天下午15点"),
+    ("昨天晚上", "应该是昨天晚上20点"),
+    ("明天早上", "应该是明天早上8点"),
+    ("前天中午", "应该是前天中午12点"),
+
+    # 具体时间点
+    ("早上8点", "应该是今天早上8点"),
+    ("下午3点", "应该是今天下午15点"),
+    ("晚上9点", "应该是今天晚上21点"),
+
+    # 具体日期
+    ("2025-11-05", "应该是2025年11月5日"),
+    ("11月5日", "应该是今年11月5日"),
+    ("11-05", "应该是今年11月5日"),
+
+    # 周/月/年
+    ("上周", "应该是上周"),
+    ("上个月", "应该是上个月"),
+    ("去年", "应该是去年"),
+
+    # 中文数字
+    ("一天前", "应该是昨天"),
+    ("三天前", "应该是3天前"),
+    ("五天后", "应该是5天后"),
+    ("十天前", "应该是10天前"),
+)
+
 
 def test_time_parser():
     """测试时间解析器的各种情况"""
@@ -16,105 +93,43 @@ def test_time_parser():
     reference_time = datetime(2025, 11, 5, 15, 30, 0)  # 2025年11月5日 15:30
     parser = TimeParser(reference_time=reference_time)
     
-    print("=" * 60)
+    print(SEPARATOR)
     print("时间解析器增强测试")
-    print("=" * 60)
+    print(SEPARATOR)
     print(f"参考时间: {reference_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    test_cases = [
-        # 相对日期
-        ("今天", "应该是今天0点"),
-        ("明天", "应该是明天0点"),
-        ("昨天", "应该是昨天0点"),
-        ("前天", "应该是前天0点"),
-        ("后天", "应该是后天0点"),
-        
-        # X天前/后
-        ("1天前", "应该是昨天0点"),
-        ("2天前", "应该是前天0点"),
-        ("5天前", "应该是5天前0点"),
-        ("3天后", "应该是3天后0点"),
-        
-        # X周前/后（新增）
-        ("1周前", "应该是1周前0点"),
-        ("2周前", "应该是2周前0点"),
-        ("3周后", "应该是3周后0点"),
-        
-        # X个月前/后（新增）
-        ("1个月前", "应该是约30天前"),
-        ("2月前", "应该是约60天前"),
-        ("3个月后", "应该是约90天后"),
-        
-        # X年前/后（新增）
-        ("1年前", "应该是约365天前"),
-        ("2年后", "应该是约730天后"),
-        
-        # X小时前/后
-        ("1小时前", "应该是1小时前"),
-        ("3小时前", "应该是3小时前"),
-        ("2小时后", "应该是2小时后"),
-        
-        # X分钟前/后
-        ("30分钟前", "应该是30分钟前"),
-        ("15分钟后", "应该是15分钟后"),
-        
-        # 时间段
-        ("早上", "应该是今天早上8点"),
-        ("上午", "应该是今天上午10点"),
-        ("中午", "应该是今天中午12点"),
-        ("下午", "应该是今天下午15点"),
-        ("晚上", "应该是今天晚上20点"),
-        
-        # 组合表达（新增）
-        ("今天下午", "应该是今天下午15点"),
-        ("昨天晚上", "应该是昨天晚上20点"),
-        ("明天早上", "应该是明天早上8点"),
-        ("前天中午", "应该是前天中午12点"),
-        
-        # 具体时间点
-        ("早上8点", "应该是今天早上8点"),
-        ("下午3点", "应该是今天下午15点"),
-        ("晚上9点", "应该是今天晚上21点"),
-        
-        # 具体日期
-        ("2025-11-05", "应该是2025年11月5日"),
-        ("11月5日", "应该是今年11月5日"),
-        ("11-05", "应该是今年11月5日"),
-        
-        # 周/月/年
-        ("上周", "应该是上周"),
-        ("上个月", "应该是上个月"),
-        ("去年", "应该是去年"),
-        
-        # 中文数字
-        ("一天前", "应该是昨天"),
-        ("三天前", "应该是3天前"),
-        ("五天后", "应该是5天后"),
-        ("十天前", "应该是10天前"),
-    ]
+    # 按 UTC 解释 naive 时间再取时间戳，避免本地夏令时切换带来的一小时偏差
+    ref_ts = reference_time.replace(tzinfo=timezone.utc).timestamp()
     
     success_count = 0
     fail_count = 0
+    rows = []
+    
+    # TimeParser 只持有只读的 reference_time，可并发解析；输出仍按用例顺序串行生成
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parser.parse, (time_str for time_str, _ in _TEST_CASES)))
     
-    for time_str, expected_desc in test_cases:
-        result = parser.parse(time_str)
+    for (time_str, expected_desc), result in zip(_TEST_CASES, results):
         
         # 计算与参考时间的差异
         if result:
-            diff = result - reference_time
+            diff_seconds = result.replace(tzinfo=timezone.utc).timestamp() - ref_ts
+            # 与 timedelta 一致: days 向下取整, 余下秒数落在 [0, 86400)
+            days, seconds = divmod(diff_seconds, 86400)
+            days, seconds = int(days), int(seconds)
             
             # 格式化输出
-            if diff.total_seconds() == 0:
+            if diff_seconds == 0:
                 diff_str = "当前时间"
-            elif abs(diff.days) > 0:
-                if diff.days > 0:
-                    diff_str = f"+{diff.days}天"
+            elif days != 0:
+                if days > 0:
+                    diff_str = f"+{days}天"
                 else:
-                    diff_str = f"{diff.days}天"
+                    diff_str = f"{days}天"
             else:
-                hours = diff.seconds // 3600
-                minutes = (diff.seconds % 3600) // 60
+                hours, seconds = divmod(seconds, 3600)
+                minutes = seconds // 60
                 if hours > 0:
                     diff_str = f"{hours}小时"
                 else:
@@ -129,18 +144,20 @@ def test_time_parser():
             status = "[FAILED]"
             fail_count += 1
         
-        print(f"{status} '{time_str:15s}' -> {result_str:20s} ({diff_str:10s}) | {expected_desc}")
+        rows.append(f"{status} '{time_str:15s}' -> {result_str:20s} ({diff_str:10s}) | {expected_desc}")
     
+    # 结果行统一缓冲后一次性输出
+    sys.stdout.write("\n".join(rows) + "\n")
     print()
-    print("=" * 60)
-    print(f"测试结果: 成功 {success_count}/{len(test_cases)}, 失败 {fail_count}/{len(test_cases)}")
+    print(SEPARATOR)
+    print(f"测试结果: 成功 {success_count}/{len(_TEST_CASES)}, 失败 {fail_count}/{len(_TEST_CASES)}")
     
     if fail_count == 0:
         print("[SUCCESS] 所有测试通过！")
     else:
         print(f"[WARNING] 有 {fail_count} 个测试失败")
     
-    print("=" * 60)
+    print(SEPARATOR)
 
 
 if __name__ == "__main__":